@@ -1,44 +1,85 @@
 """The Olife Energy Wallbox integration."""
 import asyncio
 import logging
-from typing import Optional
+import time
+from datetime import timedelta
+from dataclasses import dataclass, fields
+from typing import Final, Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_NAME
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import DeviceInfo
 
 from .const import (
     DOMAIN, 
     PLATFORMS,
+    DATA_CLIENTS,
+    DATA_ENTRIES,
+    DATA_SERVICES,
     CONF_READ_ONLY,
     DEFAULT_READ_ONLY,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    CONF_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    CONF_ENABLE_PHASE_SENSORS,
+    CONF_ENABLE_ERROR_SENSORS,
+    DEFAULT_ENABLE_PHASE_SENSORS,
+    DEFAULT_ENABLE_ERROR_SENSORS,
     CONF_SLAVE_ID,
+    CACHED_DEVICE_INFO,
+    CACHED_DEVICE_INFO_AT,
+    DEVICE_INFO_CACHE_TTL,
     REG_HW_VERSION,
     REG_SW_VERSION,
     REG_NUM_CONNECTORS,
     REG_SN_FIRST_PART,
     REG_SN_LAST_PART,
-    REG_YEAR_MONTH,
-    REG_DAY_HOUR,
     REG_PN_TYPE,
-    REG_PN_LEFT,
-    REG_PN_RIGHT
-)
-from .services import async_setup_services, async_unload_services
-from .modbus_client import OlifeWallboxModbusClient
-from .solar_control import OlifeSolarOptimizer
-from .const import (
     CONF_SOLAR_POWER_ENTITY,
     CONF_CHARGING_PHASES,
     CONF_MIN_CURRENT_OFFSET,
     DEFAULT_CHARGING_PHASES,
     DEFAULT_MIN_CURRENT_OFFSET,
 )
+from .services import async_setup_services, async_unload_services
+from .modbus_client import OlifeWallboxModbusClient
+from .solar_control import OlifeSolarOptimizer
+from .helpers import (
+    async_invalidate_device_info_cache,
+    async_read_registers,
+    format_device_unique_id,
+)
+from .coordinator import OlifeWallboxCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Platforms set up for entries in read-only mode
+_RO_PLATFORMS: Final = ("sensor",)
+
+# Registers read during device discovery
+DISCOVERY_REGISTERS = (
+    REG_HW_VERSION,
+    REG_SW_VERSION,
+    REG_SN_FIRST_PART,
+    REG_SN_LAST_PART,
+    REG_PN_TYPE,
+    REG_NUM_CONNECTORS,
+)
+
+# Decode tables for the digits of the PN registers
+_STATION_TYPES = {1: "WB (Wallbox)", 2: "DB (DoubleBox)", 3: "ST (Station)"}
+_STATION_VARIANTS = {1: "Base", 2: "Smart"}
+
+
+def _fmt_version(value: int) -> str:
+    """Format a version register (e.g. 105) as a version string (e.g. "1.05")."""
+    major, minor = divmod(value, 100)
+    return f"{major}.{minor:02d}"
+
 
 def _normalize_connector_count(raw_value: Optional[int]) -> tuple[int, list[str]]:
     """Validate reported connector count and map to connectors."""
@@ -54,93 +95,280 @@ def _normalize_connector_count(raw_value: Optional[int]) -> tuple[int, list[str]
     _LOGGER.warning("Device reported %s connectors; restricting to first two connectors", raw_value)
     return 2, ["A", "B"]
 
+@dataclass(frozen=True, slots=True)
+class OlifeOptions:
+    """Options of a config entry, resolved once."""
+
+    read_only: bool
+    scan_interval: int
+    timeout: int
+    enable_phase_sensors: bool
+    enable_error_sensors: bool
+    solar_entity: Optional[str]
+    charging_phases: int
+    min_offset: int
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry) -> "OlifeOptions":
+        """Build the options from a config entry, applying the defaults."""
+        options = entry.options
+        return cls(
+            read_only=options.get(CONF_READ_ONLY, DEFAULT_READ_ONLY),
+            scan_interval=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            timeout=options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
+            enable_phase_sensors=options.get(CONF_ENABLE_PHASE_SENSORS, DEFAULT_ENABLE_PHASE_SENSORS),
+            enable_error_sensors=options.get(CONF_ENABLE_ERROR_SENSORS, DEFAULT_ENABLE_ERROR_SENSORS),
+            solar_entity=options.get(CONF_SOLAR_POWER_ENTITY) or None,
+            charging_phases=options.get(CONF_CHARGING_PHASES, DEFAULT_CHARGING_PHASES),
+            min_offset=options.get(CONF_MIN_CURRENT_OFFSET, DEFAULT_MIN_CURRENT_OFFSET),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _EntryConfig:
+    """Connection settings and options of a config entry, resolved once."""
+
+    host: str
+    port: int
+    slave_id: int
+    name: str
+    read_only: bool
+    platforms: tuple[str, ...]
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry, options: OlifeOptions) -> "_EntryConfig":
+        """Build the config from a config entry's data and resolved options."""
+        read_only = options.read_only
+        return cls(
+            host=entry.data[CONF_HOST],
+            port=int(entry.data.get(CONF_PORT, 502)),
+            slave_id=int(entry.data.get(CONF_SLAVE_ID, 1)),
+            name=entry.data.get(CONF_NAME, "Olife Wallbox"),
+            read_only=read_only,
+            platforms=_RO_PLATFORMS if read_only else PLATFORMS,
+        )
+
+
+@dataclass(slots=True)
+class OlifeWallboxData:
+    """Runtime data of a loaded config entry, stored as entry.runtime_data."""
+
+    client: OlifeWallboxModbusClient
+    device_info: dict
+    # Device information shared by all entities of the entry
+    device: DeviceInfo
+    # Prefix of the unique IDs of the entry's entities
+    device_unique_id: str
+    config: _EntryConfig
+    # Options the entry was set up with, read by the platforms and used to
+    # tell what an options update changed
+    options: OlifeOptions
+    coordinator: Optional[OlifeWallboxCoordinator] = None
+    solar_optimizer: Optional[OlifeSolarOptimizer] = None
+
+    def get_solar_optimizer(self, hass: HomeAssistant) -> Optional[OlifeSolarOptimizer]:
+        """Return the solar optimizer, creating it on first use.
+
+        Returns None when no solar power entity is configured.
+        """
+        if self.solar_optimizer is None:
+            solar_entity = self.options.solar_entity
+            if not solar_entity:
+                return None
+            self.solar_optimizer = OlifeSolarOptimizer(
+                hass,
+                self.client,
+                solar_entity,
+                self.options.charging_phases,
+                self.options.min_offset,
+                # The max station current entity is looked up by the optimizer
+                None,
+            )
+            _LOGGER.debug("Solar optimizer created for %s", solar_entity)
+        return self.solar_optimizer
+
+
+def _acquire_client(
+    hass: HomeAssistant, host: str, port: int, slave_id: int, timeout: int
+) -> OlifeWallboxModbusClient:
+    """Return the shared client for a device, creating it on first use."""
+    clients = hass.data[DOMAIN].setdefault(DATA_CLIENTS, {})
+    key = (host, port, slave_id)
+    if key in clients:
+        clients[key]["refcount"] += 1
+        _LOGGER.debug("Reusing Modbus client for %s:%s (slave %s)", host, port, slave_id)
+    else:
+        clients[key] = {
+            "client": OlifeWallboxModbusClient(host, port, slave_id, timeout),
+            "refcount": 1,
+        }
+    return clients[key]["client"]
+
+
+def _release_client(
+    hass: HomeAssistant, host: str, port: int, slave_id: int
+) -> Optional[OlifeWallboxModbusClient]:
+    """Release a shared client, returning it once it is no longer used."""
+    clients = hass.data[DOMAIN].get(DATA_CLIENTS, {})
+    key = (host, port, slave_id)
+    if key not in clients:
+        return None
+    clients[key]["refcount"] -= 1
+    if clients[key]["refcount"] > 0:
+        return None
+    return clients.pop(key)["client"]
+
+
+async def _async_release_client(hass: HomeAssistant, host: str, port: int, slave_id: int) -> None:
+    """Release a shared client and disconnect it once it is no longer used."""
+    client = _release_client(hass, host, port, slave_id)
+    if client is not None:
+        await client.disconnect()
+
+
+def _loaded_entry_ids(hass: HomeAssistant) -> set[str]:
+    """Return the ids of the config entries that are currently loaded."""
+    return hass.data.get(DOMAIN, {}).get(DATA_ENTRIES, set())
+
+
+def _get_cached_device_info(entry: ConfigEntry) -> Optional[dict]:
+    """Return device information cached by a previous setup, if still fresh."""
+    cached = entry.data.get(CACHED_DEVICE_INFO)
+    cached_at = entry.data.get(CACHED_DEVICE_INFO_AT, 0)
+    if not cached or time.time() - cached_at > DEVICE_INFO_CACHE_TTL:
+        return None
+    _LOGGER.debug("Using cached device information for %s", entry.title)
+    return dict(cached)
+
+
+async def _async_read_device_info(client: OlifeWallboxModbusClient) -> dict:
+    """Read identification registers and decode them into a device info dict."""
+    device_info = {}
+
+    try:
+        # Read all identification registers in as few requests as possible
+        registers = await async_read_registers(client, DISCOVERY_REGISTERS)
+
+        # Hardware and software version (these can help identify capabilities)
+        if REG_HW_VERSION in registers:
+            device_info["hw_version"] = _fmt_version(registers[REG_HW_VERSION])
+
+        if REG_SW_VERSION in registers:
+            device_info["sw_version"] = _fmt_version(registers[REG_SW_VERSION])
+
+        # Station type, e.g. 32 = ST (Station) Smart
+        pn_type = registers.get(REG_PN_TYPE)
+        if pn_type is not None and 0 < pn_type < 100:
+            station_type = _STATION_TYPES.get(pn_type // 10, "Unknown")
+            station_variant = _STATION_VARIANTS.get(pn_type % 10, "Unknown")
+            device_info["model"] = f"{station_type} {station_variant}"
+
+        # Number of connectors
+        if REG_NUM_CONNECTORS in registers:
+            raw_count = registers[REG_NUM_CONNECTORS]
+            connector_count, connectors_in_use = _normalize_connector_count(raw_count)
+            device_info["num_connectors"] = connector_count
+            device_info["connectors_in_use"] = connectors_in_use
+
+        # Serial number - two registers that need special handling
+        if REG_SN_FIRST_PART in registers and REG_SN_LAST_PART in registers:
+            sn_first_val = registers[REG_SN_FIRST_PART]
+            sn_last_val = registers[REG_SN_LAST_PART]
+            device_info["serial_number"] = f"{sn_first_val:03d}{sn_last_val:03d}"
+    except Exception as ex:
+        _LOGGER.warning("Failed to read device information: %s", ex)
+        # Continue with default values if reading device info fails
+
+    return device_info
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Olife Energy Wallbox from a config entry."""
+    # Set once the shared client is acquired, so a failed setup releases it
+    client = None
     try:
-        # Get configuration from entry
-        host = entry.data[CONF_HOST]
-        port = int(entry.data.get(CONF_PORT, 502))
-        slave_id = int(entry.data.get(CONF_SLAVE_ID, 1))
-        name = entry.data.get(CONF_NAME, "Olife Wallbox")
-        
-        # Get options or defaults
-        read_only = entry.options.get(CONF_READ_ONLY, DEFAULT_READ_ONLY)
-        
-        # Create a ModbusClient instance
-        client = OlifeWallboxModbusClient(host, port, slave_id)
+        # Resolve configuration and options once
+        options = OlifeOptions.from_entry(entry)
+        cfg = _EntryConfig.from_entry(entry, options)
+        host, port, slave_id, name = cfg.host, cfg.port, cfg.slave_id, cfg.name
+
+        hass.data.setdefault(DOMAIN, {})
+
+        # Get the ModbusClient shared by all entries for this device
+        client = _acquire_client(hass, host, port, slave_id, options.timeout)
         if not await client.connect():
-            await client.disconnect()
+            async_invalidate_device_info_cache(hass, entry)
+            # Only drop the reference, the client closes its own socket when
+            # the connection fails so there is nothing to disconnect
+            _release_client(hass, host, port, slave_id)
+            client = None
             _LOGGER.error("Failed to connect to Olife Wallbox at %s:%s", host, port)
             raise ConfigEntryNotReady("Failed to connect to device")
+
+        # Probe the device with a single read so an unresponsive device fails
+        # fast instead of timing out on every discovery read. The deadline
+        # follows the configured Modbus timeout, slow devices need a long one
+        try:
+            async with asyncio.timeout(options.timeout):
+                answered = await client.probe(REG_HW_VERSION)
+        except asyncio.TimeoutError:
+            answered = False
+        if not answered:
+            async_invalidate_device_info_cache(hass, entry)
+            await _async_release_client(hass, host, port, slave_id)
+            client = None
+            _LOGGER.error("Olife Wallbox at %s:%s did not answer", host, port)
+            raise ConfigEntryNotReady("Device did not answer")
             
+        # Identifies the device in the registry and prefixes the entity unique IDs
+        device_unique_id = format_device_unique_id(host, port, slave_id)
+        identifiers = {(DOMAIN, device_unique_id)}
+
         # Update the device registry - since 2022.8, this is recommended even before platform setup
         device_registry = dr.async_get(hass)
-        device_registry.async_get_or_create(
+        device_entry = device_registry.async_get_or_create(
             config_entry_id=entry.entry_id,
             name=name,
             manufacturer="Olife Energy",
             model="Wallbox",
             # Use Wifi icon since there's no specific Wallbox icon
             suggested_area="Garage",
-            identifiers={(DOMAIN, f"{host}_{port}_{slave_id}")},
+            identifiers=identifiers,
             sw_version="unknown",  # Will be updated later
             hw_version="unknown",  # Will be updated later
         )
         
-        # Read system and device information
-        device_info = {}
-        
-        try:
-            # Hardware and software version (these can help identify capabilities)
-            hw_version = await client.read_holding_registers(REG_HW_VERSION, 1)
-            sw_version = await client.read_holding_registers(REG_SW_VERSION, 1)
-            
-            # Number of connectors
-            num_connectors = await client.read_holding_registers(REG_NUM_CONNECTORS, 1)
-            
-            # Serial number - two registers that need special handling
-            sn_first = await client.read_holding_registers(REG_SN_FIRST_PART, 1)
-            sn_last = await client.read_holding_registers(REG_SN_LAST_PART, 1)
-            
-            if hw_version is not None and len(hw_version) >= 1:
-                hw_value = hw_version[0]
-                hw_major = hw_value // 100
-                hw_minor = hw_value % 100
-                device_info["hw_version"] = f"{hw_major}.{hw_minor:02d}"
-                
-            if sw_version is not None and len(sw_version) >= 1:
-                sw_value = sw_version[0]
-                sw_major = sw_value // 100
-                sw_minor = sw_value % 100
-                device_info["sw_version"] = f"{sw_major}.{sw_minor:02d}"
-                
-            if num_connectors is not None and len(num_connectors) >= 1:
-                raw_count = num_connectors[0]
-                connector_count, connectors_in_use = _normalize_connector_count(raw_count)
-                device_info["num_connectors"] = connector_count
-                device_info["connectors_in_use"] = connectors_in_use
-                
-            if sn_first is not None and sn_last is not None:
-                if len(sn_first) >= 1 and len(sn_last) >= 1:
-                    sn_first_val = sn_first[0]
-                    sn_last_val = sn_last[0]
-                    serial_number = f"{sn_first_val:03d}{sn_last_val:03d}"
-                    device_info["serial_number"] = serial_number
-                    
-            # Update the device registry with the device information
+        # Reuse the identification read on a previous setup if it is recent,
+        # otherwise read it from the device
+        device_info = _get_cached_device_info(entry)
+        if device_info is None:
+            device_info = await _async_read_device_info(client)
+            if device_info:
+                hass.config_entries.async_update_entry(
+                    entry,
+                    data={
+                        **entry.data,
+                        CACHED_DEVICE_INFO: dict(device_info),
+                        CACHED_DEVICE_INFO_AT: time.time(),
+                    },
+                )
+
+        # Update the device registry with the device information, unless
+        # nothing was learned and the defaults from above still apply
+        learned = any(
+            key in device_info
+            for key in ("hw_version", "sw_version", "num_connectors", "serial_number")
+        )
+        if learned:
             device_registry.async_update_device(
-                device_id=device_registry.async_get_device(identifiers={(DOMAIN, f"{host}_{port}_{slave_id}")}).id,
+                device_id=device_entry.id,
                 name=name,
                 manufacturer="Olife Energy",
                 model=f"Wallbox ({device_info.get('num_connectors', '?')}-connector)",
                 sw_version=device_info.get("sw_version", "Unknown"),
                 hw_version=device_info.get("hw_version", "Unknown"),
             )
-            
-        except Exception as ex:
-            _LOGGER.warning("Failed to read device information: %s", ex)
-            # Continue with default values if reading device info fails
-        
+
         # Default data
         if "num_connectors" not in device_info:
             device_info["num_connectors"] = 1
@@ -162,94 +390,111 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         }
         
         # Store the client and device info for platform access
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][entry.entry_id] = {
-            "client": client,
-            "device_info": clean_device_info,
-            "read_only": read_only,
-        }
+        device = DeviceInfo(
+            identifiers=identifiers,
+            name=name,
+            manufacturer="Olife Energy",
+            model=clean_device_info["model"],
+            sw_version=clean_device_info["sw_version"],
+            hw_version=clean_device_info["hw_version"],
+            serial_number=clean_device_info["serial_number"],
+        )
+        entry.runtime_data = OlifeWallboxData(
+            client=client,
+            device_info=clean_device_info,
+            device=device,
+            device_unique_id=device_unique_id,
+            config=cfg,
+            options=options,
+        )
 
-        # Initialize Solar Optimizer if configured
-        solar_entity = entry.options.get(CONF_SOLAR_POWER_ENTITY)
-        if solar_entity:
-            charging_phases = entry.options.get(CONF_CHARGING_PHASES, DEFAULT_CHARGING_PHASES)
-            min_offset = entry.options.get(CONF_MIN_CURRENT_OFFSET, DEFAULT_MIN_CURRENT_OFFSET)
-            
-            # Construct max station current entity ID
-            # This is a bit of a guess, ideally we'd get the entity ID from the entity registry
-            # But we can also pass the entity object if we refactor, or just look it up dynamically
-            # For now, let's pass None and let the optimizer handle it or look it up if we can find a way
-            # Actually, we can construct the ID if we know the format: number.name_max_station_current
-            # But names can change. 
-            # Let's try to find the entity ID from the device registry or entity registry
-            
-            optimizer = OlifeSolarOptimizer(
-                hass, 
-                client, 
-                solar_entity, 
-                charging_phases, 
-                min_offset,
-                # We'll implement dynamic max current lookup inside the optimizer or pass None for now
-                None 
+        # One coordinator polls the device for all platforms, fetch the
+        # initial data so the entities have a state when they are added
+        coordinator = OlifeWallboxCoordinator(hass, entry, client, clean_device_info)
+        await coordinator.async_refresh()
+        entry.runtime_data.coordinator = coordinator
+        hass.data[DOMAIN].setdefault(DATA_ENTRIES, set()).add(entry.entry_id)
+
+        # Register services once, they are shared by all entries
+        if not hass.data[DOMAIN].get(DATA_SERVICES):
+            hass.data[DOMAIN][DATA_SERVICES] = True
+            # Services are not needed by the platforms, register them off the
+            # setup path so the entry finishes setting up sooner
+            hass.async_create_background_task(
+                async_setup_services(hass), f"{DOMAIN}_setup_services"
             )
-            hass.data[DOMAIN][entry.entry_id]["solar_optimizer"] = optimizer
-            # Don't auto-enable - let the solar mode switch control it
-            _LOGGER.info("Solar optimizer created but not enabled - use Solar Mode switch to enable")
-        
-        
-        # Register services once (on first setup)
-        if len(hass.data[DOMAIN]) == 1:
-            # Register services
-            await async_setup_services(hass)
         
         # Register a listener for option updates
         entry.async_on_unload(entry.add_update_listener(async_options_updated))
         
         # Forward setup to platforms - use the recommended approach
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        await hass.config_entries.async_forward_entry_setups(entry, cfg.platforms)
         
         return True
+    except ConfigEntryNotReady:
+        # Let Home Assistant retry the setup later
+        raise
     except Exception as ex:
         _LOGGER.error("Failed to set up Olife Wallbox: %s", ex)
-        # Only try to disconnect if client was created
-        if 'client' in locals():
-            await client.disconnect()
+        # Only try to release the client if it was acquired
+        if client is not None:
+            await _async_release_client(hass, host, port, slave_id)
         return False
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    # Get options to determine which platforms were loaded
-    read_only = entry.options.get(CONF_READ_ONLY, DEFAULT_READ_ONLY)
-    platforms_to_unload = ["sensor"] if read_only else PLATFORMS
-    
+    # Use the config resolved at setup so the same platforms are unloaded
+    data: Optional[OlifeWallboxData] = getattr(entry, "runtime_data", None)
+    cfg = (
+        data.config if data is not None
+        else _EntryConfig.from_entry(entry, OlifeOptions.from_entry(entry))
+    )
+
     # Unload platforms
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms_to_unload)
-    
-    # Disconnect client
-    if unload_ok and hass.data[DOMAIN].get(entry.entry_id):
-        client = hass.data[DOMAIN][entry.entry_id].get("client")
-        if client:
-            await client.disconnect()
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, cfg.platforms)
+
+    # Keep the runtime data around if the platforms are still loaded
+    if unload_ok and data is not None:
+        _loaded_entry_ids(hass).discard(entry.entry_id)
+
+        # Release the shared client, it is disconnected once no entry uses it
+        await _async_release_client(hass, cfg.host, cfg.port, cfg.slave_id)
 
         # Clean up coordinator if it exists
-        coordinator = hass.data[DOMAIN][entry.entry_id].get("coordinator")
-        if coordinator:
+        if data.coordinator is not None:
             # Stop the coordinator to prevent memory leaks
-            await coordinator.async_shutdown()
+            await data.coordinator.async_shutdown()
 
-        hass.data[DOMAIN].pop(entry.entry_id)
-    
-    # Unload solar optimizer
-    if hass.data[DOMAIN].get(entry.entry_id) and "solar_optimizer" in hass.data[DOMAIN][entry.entry_id]:
-        hass.data[DOMAIN][entry.entry_id]["solar_optimizer"].disable()
+        # Unload solar optimizer
+        if data.solar_optimizer is not None:
+            data.solar_optimizer.disable()
 
     # Unload services if this is the last entry
-    if not hass.data[DOMAIN]:
+    if not _loaded_entry_ids(hass):
         async_unload_services(hass)
     
     return unload_ok
 
 async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
+    data: Optional[OlifeWallboxData] = getattr(entry, "runtime_data", None)
+    if data is not None:
+        options = OlifeOptions.from_entry(entry)
+        if options == data.options:
+            # Only the entry data changed, e.g. the cached device information
+            return
+
+        changed = {
+            option.name for option in fields(OlifeOptions)
+            if getattr(options, option.name) != getattr(data.options, option.name)
+        }
+        data.options = options
+
+        if changed == {"scan_interval"} and data.coordinator is not None:
+            # Apply the new polling interval to the running coordinator
+            data.coordinator.update_interval = timedelta(seconds=options.scan_interval)
+            _LOGGER.debug("Scan interval changed to %s seconds", options.scan_interval)
+            return
+
     _LOGGER.debug("Configuration options updated, reloading entry")
     await hass.config_entries.async_reload(entry.entry_id) 
\ No newline at end of file
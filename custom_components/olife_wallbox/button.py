@@ -1,11 +1,10 @@
 """Button platform for Olife Energy Wallbox integration."""
+import asyncio
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.const import (
-    CONF_HOST, 
-    CONF_PORT, 
     CONF_NAME,
     STATE_UNAVAILABLE
 )
@@ -16,41 +15,35 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
-    DOMAIN,
-    CONF_SLAVE_ID,
-    CONF_READ_ONLY,
-    DEFAULT_READ_ONLY,
     REG_CHARGING_ENABLE_A,
     REG_CHARGING_ENABLE_B,
     ERROR_LOG_THRESHOLD
 )
 from .modbus_client import OlifeWallboxModbusClient
-from .helpers import parse_device_unique_id, DeviceUniqueIdError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Presses arriving within this many seconds share a single register write
+PRESS_COALESCE_WINDOW = 0.05
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
     """Set up the Olife Energy Wallbox button platform."""
     try:
-        name = entry.data[CONF_NAME]
-        host = entry.data[CONF_HOST]
-        port = entry.data[CONF_PORT]
-        slave_id = entry.data[CONF_SLAVE_ID]
-
-        # Check if we're in read-only mode
-        read_only = entry.options.get(CONF_READ_ONLY, DEFAULT_READ_ONLY)
+        entry_data = entry.runtime_data
 
-        if read_only:
+        # Check if we're in read-only mode before looking anything else up
+        if entry_data.options.read_only:
             _LOGGER.info("Running in read-only mode, no button entities will be created")
             return
 
-        # Use the shared client and device info from hass.data
-        entry_data = hass.data[DOMAIN][entry.entry_id]
-        client = entry_data["client"]
-        device_info = entry_data["device_info"]
-        device_unique_id = f"{host}_{port}_{slave_id}"
+        name = entry.data[CONF_NAME]
+
+        # Use the shared client and device info from the entry runtime data
+        client = entry_data.client
+        device_info = entry_data.device
+        device_unique_id = entry_data.device_unique_id
             
         entities = [
             OlifeWallboxChargingAuthorizationButton(client, name, device_info, device_unique_id),
@@ -63,6 +56,18 @@ async def async_setup_entry(
 class OlifeWallboxButtonBase(ButtonEntity):
     """Base class for Olife Energy Wallbox buttons."""
 
+    __slots__ = (
+        "_client",
+        "_name",
+        "_available",
+        "_device_info",
+        "_device_unique_id",
+        "_error_count",
+        "_next_log_count",
+        "_register",
+        "_pending_press",
+    )
+
     def __init__(self, client, name, device_info, device_unique_id):
         """Initialize the button."""
         self._client = client
@@ -73,7 +78,11 @@ class OlifeWallboxButtonBase(ButtonEntity):
         self._attr_has_entity_name = True
         self._attr_should_poll = False  # Buttons don't need polling
         self._error_count = 0
+        # Error count at which the next error is logged
+        self._next_log_count = 1
         self._register = None  # Subclasses need to define this
+        # Write shared by the presses of the current coalescing window
+        self._pending_press: Optional[asyncio.Task] = None
         
     @property
     def available(self):
@@ -83,35 +92,36 @@ class OlifeWallboxButtonBase(ButtonEntity):
     @property
     def device_info(self):
         """Return device information."""
-        # Filter device_info to only include valid DeviceInfo parameters
-        # Construct the identifiers from device_unique_id
-        try:
-            host, port, slave_id = parse_device_unique_id(self._device_unique_id)
-        except DeviceUniqueIdError as exc:
-            _LOGGER.error("Invalid device_unique_id format: %s", exc)
-            # Fallback to prevent crash
-            host, port, slave_id = "unknown", 0, 0
-        return {
-            "identifiers": {(DOMAIN, self._device_unique_id)},
-            "name": self._name,
-            "manufacturer": "Olife Energy",
-            "model": self._device_info.get("model", "Wallbox"),
-            "sw_version": self._device_info.get("sw_version", "Unknown"),
-            "hw_version": self._device_info.get("hw_version", "Unknown"),
-            "serial_number": self._device_info.get("serial_number"),
-            "via_device": self._device_info.get("via_device"),
-        }
+        return self._device_info
 
     def _should_log_error(self):
         """Determine whether to log an error based on error count."""
-        return self._error_count == 1 or self._error_count % ERROR_LOG_THRESHOLD == 0
+        if self._error_count == 1:
+            # First error after a success, restart the logging schedule
+            self._next_log_count = 1
+        if self._error_count < self._next_log_count:
+            return False
+        self._next_log_count += ERROR_LOG_THRESHOLD
+        return True
             
     async def async_press(self) -> None:
         """Press the button."""
         if not self._register:
             _LOGGER.error("Register not defined for %s", self.name)
             raise HomeAssistantError(f"Register not defined for {self.name}")
-            
+
+        # A burst of presses, e.g. from a scene, results in one write
+        if self._pending_press is None:
+            self._pending_press = self.hass.async_create_task(self._async_write_press())
+        # Shield the shared write so a cancelled caller does not cancel it for the others
+        await asyncio.shield(self._pending_press)
+
+    async def _async_write_press(self) -> None:
+        """Write the register once for all presses of the coalescing window."""
+        await asyncio.sleep(PRESS_COALESCE_WINDOW)
+        # Presses from now on need a write of their own
+        self._pending_press = None
+
         try:
             _LOGGER.debug("Pressing %s", self.name)
             
@@ -146,18 +156,6 @@ class OlifeWallboxChargingAuthorizationButton(OlifeWallboxButtonBase):
         # TODO: Accept connector parameter explicitly for dual-connector support
         self._register = REG_CHARGING_ENABLE_B
         self._attr_entity_category = None  # Main control
-        
-    @property
-    def name(self):
-        """Return the name of the button."""
-        return "Charging Authorization"
-        
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return f"{self._device_unique_id}_charging_auth_button"
-        
-    @property
-    def icon(self):
-        """Return the icon to use in the frontend."""
-        return "mdi:account-check"
+        self._attr_name = "Charging Authorization"
+        self._attr_unique_id = f"{device_unique_id}_charging_auth_button"
+        self._attr_icon = "mdi:account-check"
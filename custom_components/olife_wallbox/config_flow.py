@@ -1,13 +1,14 @@
 """Config flow for Olife Energy Wallbox integration."""
+import asyncio
 import logging
+import time
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_NAME
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import config_validation as cv
 
-from pymodbus.client import ModbusTcpClient
+from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ConnectionException
 
 from .const import (
@@ -17,6 +18,8 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     CONF_SLAVE_ID,
     CONF_SCAN_INTERVAL,
+    CONF_TIMEOUT,
+    DEFAULT_TIMEOUT,
     # Sensor groups options
     CONF_ENABLE_PHASE_SENSORS,
     CONF_ENABLE_ERROR_SENSORS,
@@ -24,7 +27,6 @@ from .const import (
     DEFAULT_ENABLE_PHASE_SENSORS,
     DEFAULT_ENABLE_ERROR_SENSORS,
 
-    CONF_READ_ONLY,
     CONF_READ_ONLY,
     DEFAULT_READ_ONLY,
     CONF_SOLAR_POWER_ENTITY,
@@ -34,41 +36,86 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-async def validate_connection(hass: HomeAssistant, data):
+# Seconds allowed for connecting to the device and reading one register
+VALIDATION_TIMEOUT = 5
+# Socket timeout of the validation client, so a firewalled host fails fast
+VALIDATION_SOCKET_TIMEOUT = 3
+# Seconds a successful validation is reused, e.g. when the form is resubmitted
+VALIDATION_CACHE_TTL = 600
+
+# Monotonic time of the last successful validation per (host, port, slave_id)
+_validated: dict[tuple[str, int, int], float] = {}
+
+# The form schemas are built once, the values to show are filled in with
+# add_suggested_values_to_schema
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME, default="Olife Wallbox"): str,
+        vol.Required(CONF_HOST, default=""): str,
+        vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
+        vol.Required(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): int,
+    }
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_READ_ONLY, default=DEFAULT_READ_ONLY): bool,
+        vol.Optional(
+            CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+        vol.Optional(
+            CONF_TIMEOUT, default=DEFAULT_TIMEOUT
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=30)),
+        vol.Optional(CONF_ENABLE_PHASE_SENSORS, default=DEFAULT_ENABLE_PHASE_SENSORS): bool,
+        vol.Optional(CONF_ENABLE_ERROR_SENSORS, default=DEFAULT_ENABLE_ERROR_SENSORS): bool,
+        vol.Optional(CONF_SOLAR_POWER_ENTITY): str,
+        vol.Optional(CONF_CHARGING_PHASES, default=DEFAULT_CHARGING_PHASES): vol.In([1, 3]),
+    }
+)
+
+async def validate_connection(hass: HomeAssistant, data) -> bool:
     """Validate the user input allows us to connect.
 
     Data has the keys from DATA_SCHEMA with values provided by the user.
+    Returns True when the device answered a register read.
     """
     host = data[CONF_HOST]
     port = data[CONF_PORT]
     slave_id = data[CONF_SLAVE_ID]
 
-    # Initialize with minimal parameters
-    client = ModbusTcpClient(host=host, port=port)
-    
-    # Set the slave ID directly as an attribute
-    client.unit_id = slave_id
+    key = (host, port, slave_id)
+    validated_at = _validated.get(key)
+    if validated_at is not None and time.monotonic() - validated_at < VALIDATION_CACHE_TTL:
+        return True
+    # Drop an expired entry, it is added back once the device answers
+    _validated.pop(key, None)
+
+    # Use the asyncio client so validation runs on the event loop instead
+    # of blocking it or an executor thread on an unreachable host
+    client = AsyncModbusTcpClient(host, port=port, timeout=VALIDATION_SOCKET_TIMEOUT)
     
     try:
-        if client.connect():
+        # Fail fast on a dead host instead of holding the config flow
+        async with asyncio.timeout(VALIDATION_TIMEOUT):
+            if not await client.connect():
+                _LOGGER.debug("Failed to connect to %s:%s", host, port)
+                return False
+
             # Try reading a register to verify communication
-            try:
-                # Try newer API pattern
-                result = client.read_holding_registers(2104, count=1)
-            except TypeError:
-                # Try older API pattern
-                result = client.read_holding_registers(2104, 1)
-                
-            if not result.isError():
-                return {"success": True}
-            else:
-                return {"error": "Failed to read data from the device"}
-        else:
-            return {"error": "Failed to connect to the device"}
-    except ConnectionException:
-        return {"error": "Connection error"}
-    except Exception as ex:
-        return {"error": f"An error occurred: {ex}"}
+            result = await client.read_holding_registers(2104, count=1, slave=slave_id)
+
+        if result.isError():
+            _LOGGER.debug("Failed to read data from %s:%s: %s", host, port, result)
+            return False
+        _validated[key] = time.monotonic()
+        return True
+    except (asyncio.TimeoutError, ConnectionException, OSError) as ex:
+        # Expected when the host is unreachable or not a Modbus device
+        _LOGGER.debug("Cannot connect to %s:%s: %r", host, port, ex)
+        return False
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Unexpected error validating %s:%s", host, port)
+        return False
     finally:
         client.close()
 
@@ -85,27 +132,17 @@ class OlifeWallboxConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             # Validate the connection
-            validation_result = await validate_connection(self.hass, user_input)
-            if "success" in validation_result:
+            if await validate_connection(self.hass, user_input):
                 return self.async_create_entry(
                     title=user_input[CONF_NAME],
                     data=user_input,
                 )
-            else:
-                errors["base"] = validation_result.get("error", "unknown_error")
-
-        # Fill in default values
-        if user_input is None:
-            user_input = {}
-        
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=user_input.get(CONF_NAME, "Olife Wallbox")): str,
-                vol.Required(CONF_HOST, default=user_input.get(CONF_HOST, "")): str,
-                vol.Required(CONF_PORT, default=user_input.get(CONF_PORT, DEFAULT_PORT)): int,
-                vol.Required(CONF_SLAVE_ID, default=user_input.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID)): int,
-            }
-        )
+            errors["base"] = "cannot_connect"
+
+        data_schema = STEP_USER_DATA_SCHEMA
+        if user_input is not None:
+            # Keep what the user entered when the form is shown again
+            data_schema = self.add_suggested_values_to_schema(data_schema, user_input)
 
         return self.async_show_form(
             step_id="user", data_schema=data_schema, errors=errors
@@ -130,43 +167,12 @@ class OlifeWallboxOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        options = {
-            vol.Optional(
-                CONF_READ_ONLY,
-                default=self.entry.options.get(
-                    CONF_READ_ONLY, DEFAULT_READ_ONLY
-                ),
-                description={"suggested_value": self.entry.options.get(CONF_READ_ONLY, DEFAULT_READ_ONLY)}
-            ): bool,
-            vol.Optional(
-                CONF_SCAN_INTERVAL,
-                default=self.entry.options.get(
-                    CONF_SCAN_INTERVAL, self.entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-                ),
-            ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
-            vol.Optional(
-                CONF_ENABLE_PHASE_SENSORS,
-                default=self.entry.options.get(
-                    CONF_ENABLE_PHASE_SENSORS, DEFAULT_ENABLE_PHASE_SENSORS
-                ),
-            ): bool,
-            vol.Optional(
-                CONF_ENABLE_ERROR_SENSORS,
-                default=self.entry.options.get(
-                    CONF_ENABLE_ERROR_SENSORS, DEFAULT_ENABLE_ERROR_SENSORS
-                ),
-            ): bool,
-            vol.Optional(
-                CONF_SOLAR_POWER_ENTITY,
-                description={"suggested_value": self.entry.options.get(CONF_SOLAR_POWER_ENTITY)}
-            ): str,
-            vol.Optional(
-                CONF_CHARGING_PHASES,
-                default=self.entry.options.get(
-                    CONF_CHARGING_PHASES, DEFAULT_CHARGING_PHASES
-                ),
-            ): vol.In([1, 3]),
-
+        # Suggest the current options, the scan interval may still be in the entry data
+        suggested = {
+            CONF_SCAN_INTERVAL: self.entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            **self.entry.options,
         }
-
-        return self.async_show_form(step_id="init", data_schema=vol.Schema(options)) 
\ No newline at end of file
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(OPTIONS_SCHEMA, suggested),
+        )
@@ -1,16 +1,32 @@
 """Constants for the Olife Energy Wallbox integration."""
+from types import MappingProxyType
 
 DOMAIN = "olife_wallbox"
-PLATFORMS = ["switch", "number", "sensor", "button"]
+PLATFORMS = ("switch", "number", "sensor", "button")
+
+# Key in hass.data[DOMAIN] holding the Modbus clients shared between entries
+DATA_CLIENTS = "clients"
+# Key in hass.data[DOMAIN] holding the ids of the loaded config entries
+DATA_ENTRIES = "entries"
+# Key in hass.data[DOMAIN] set while the integration services are registered
+DATA_SERVICES = "services_setup"
+# Key in hass.data[DOMAIN] caching the EV state entity of each device for
+# the device triggers
+DATA_EV_STATE_ENTITIES = "ev_state_entities"
 
 # Default values
 DEFAULT_PORT = 502
 DEFAULT_SLAVE_ID = 1
 DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_TIMEOUT = 10  # seconds
+# Registers that rarely change (external wattmeter presence) are polled on
+# this longer interval instead of every update
+SLOW_SCAN_INTERVAL = 300  # seconds
 
 # Configuration
 CONF_SLAVE_ID = "slave_id"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_TIMEOUT = "timeout"
 
 # Advanced configuration options
 CONF_ENABLE_PHASE_SENSORS = "enable_phase_sensors"
@@ -28,6 +44,11 @@ DEFAULT_READ_ONLY = False
 DEFAULT_CHARGING_PHASES = 3
 DEFAULT_MIN_CURRENT_OFFSET = 0
 
+# Device information cached in the config entry data between setups
+CACHED_DEVICE_INFO = "_cached_device_info"
+CACHED_DEVICE_INFO_AT = "_cached_at"
+DEVICE_INFO_CACHE_TTL = 24 * 60 * 60  # seconds
+
 # Error count threshold for reducing log spam
 ERROR_LOG_THRESHOLD = 10
 
@@ -88,49 +109,52 @@ REG_ENERGY_L3_A = 4004          # Energy phase 3 in mWh (x0,001 Wh)
 REG_ENERGY_SUM_A = 4006         # Total station energy in mWh (x1 Wh)
 REG_ENERGY_FLASH_A = 4008        # Energy in Wh, saved to flash every 24 hours
 
-# Connector B Registers (if present, 2100-2126, 4100-4119)
+# Connector B Registers (if present, 2100-2126, 4100-4119), at the addresses
+# of connector A's registers shifted by CONNECTOR_B_OFFSET
+CONNECTOR_B_OFFSET = 100
+
 # EVSE-A registers (second connector)
-REG_ERROR_B = 2100              # Error in binary code (connector B)
-REG_VERIFY_USER_B = 2101        # Verify user (connector B)
-REG_CP_STATE_B = 2102           # Actual state on cp conductor (connector B)
-REG_PREV_CP_STATE_B = 2103      # Last CP state (connector B)
-REG_WALLBOX_EV_STATE_B = 2104   # Actual EV state (connector B)
-REG_PREV_EV_STATE_B = 2105      # Previous EV state (connector B)
-REG_CLOUD_CURRENT_LIMIT_B = 2106 # Current limit set by external devices (connector B)
-REG_CURRENT_LIMIT_B = 2107      # Actual set current (connector B)
-REG_PP_CURRENT_LIMIT_B = 2108   # Current limit by PP resistor (connector B)
-REG_CONTACTOR_STATE_B = 2109    # Main contactor state (connector B)
-REG_CP_PWM_STATE_B = 2110        # Actual PWM value (connector B)
-REG_CP_HIGH_B = 2111            # Voltage of possitive PWM pulse (connector B)
-REG_CP_LOW_B = 2112             # Voltage of negative PWM pulse (connector B)
-REG_LOCK_STATE_B = 2113         # Lock state (connector B)
-REG_LOCK_SENSOR_B = 2114        # End sensor (connector B)
-REG_PP_RESISTOR_B = 2115         # PP resistor value (connector B)
-REG_LED_STATE_B = 2116           # Led state (connector B)
-REG_ADC_CP_B = 2117             # Value of CP in AD converter (connector B)
-REG_ADC_PP_B = 2118             # Value of PP in AD converter (connector B)
-REG_LOCK_RELEASE_B = 2119        # Emergency release of lock (connector B)
-REG_EXTERNAL_CURRENT_CONTROL_B = 2120 # External current control (connector B)
+REG_ERROR_B = REG_ERROR_A + CONNECTOR_B_OFFSET  # Error in binary code (connector B)
+REG_VERIFY_USER_B = REG_VERIFY_USER_A + CONNECTOR_B_OFFSET  # Verify user (connector B)
+REG_CP_STATE_B = REG_CP_STATE_A + CONNECTOR_B_OFFSET  # Actual state on cp conductor (connector B)
+REG_PREV_CP_STATE_B = REG_PREV_CP_STATE_A + CONNECTOR_B_OFFSET  # Last CP state (connector B)
+REG_WALLBOX_EV_STATE_B = REG_WALLBOX_EV_STATE_A + CONNECTOR_B_OFFSET  # Actual EV state (connector B)
+REG_PREV_EV_STATE_B = REG_PREV_EV_STATE_A + CONNECTOR_B_OFFSET  # Previous EV state (connector B)
+REG_CLOUD_CURRENT_LIMIT_B = REG_CLOUD_CURRENT_LIMIT_A + CONNECTOR_B_OFFSET  # Current limit set by external devices (connector B)
+REG_CURRENT_LIMIT_B = REG_CURRENT_LIMIT_A + CONNECTOR_B_OFFSET  # Actual set current (connector B)
+REG_PP_CURRENT_LIMIT_B = REG_PP_CURRENT_LIMIT_A + CONNECTOR_B_OFFSET  # Current limit by PP resistor (connector B)
+REG_CONTACTOR_STATE_B = REG_CONTACTOR_STATE_A + CONNECTOR_B_OFFSET  # Main contactor state (connector B)
+REG_CP_PWM_STATE_B = REG_CP_PWM_STATE_A + CONNECTOR_B_OFFSET  # Actual PWM value (connector B)
+REG_CP_HIGH_B = REG_CP_HIGH_A + CONNECTOR_B_OFFSET  # Voltage of possitive PWM pulse (connector B)
+REG_CP_LOW_B = REG_CP_LOW_A + CONNECTOR_B_OFFSET  # Voltage of negative PWM pulse (connector B)
+REG_LOCK_STATE_B = REG_LOCK_STATE_A + CONNECTOR_B_OFFSET  # Lock state (connector B)
+REG_LOCK_SENSOR_B = REG_LOCK_SENSOR_A + CONNECTOR_B_OFFSET  # End sensor (connector B)
+REG_PP_RESISTOR_B = REG_PP_RESISTOR_A + CONNECTOR_B_OFFSET  # PP resistor value (connector B)
+REG_LED_STATE_B = REG_LED_STATE_A + CONNECTOR_B_OFFSET  # Led state (connector B)
+REG_ADC_CP_B = REG_ADC_CP_A + CONNECTOR_B_OFFSET  # Value of CP in AD converter (connector B)
+REG_ADC_PP_B = REG_ADC_PP_A + CONNECTOR_B_OFFSET  # Value of PP in AD converter (connector B)
+REG_LOCK_RELEASE_B = REG_LOCK_RELEASE_A + CONNECTOR_B_OFFSET  # Emergency release of lock (connector B)
+REG_EXTERNAL_CURRENT_CONTROL_B = REG_EXTERNAL_CURRENT_CONTROL_A + CONNECTOR_B_OFFSET  # External current control (connector B)
 
 # Wattmeter registers (second connector)
-REG_POWER_L1_B = 4110           # Power of phase 1 in W truePOWER/RealPOWER (connector B)
-REG_POWER_L2_B = 4111           # Power of phase 2 in W truePOWER/RealPOWER (connector B)
-REG_POWER_L3_B = 4112           # Power of phase 3 in W truePOWER/RealPOWER (connector B)
-REG_POWER_SUM_B = 4113          # Sum of power on L1+L2+L3 (connector B)
+REG_POWER_L1_B = REG_POWER_L1_A + CONNECTOR_B_OFFSET  # Power of phase 1 in W truePOWER/RealPOWER (connector B)
+REG_POWER_L2_B = REG_POWER_L2_A + CONNECTOR_B_OFFSET  # Power of phase 2 in W truePOWER/RealPOWER (connector B)
+REG_POWER_L3_B = REG_POWER_L3_A + CONNECTOR_B_OFFSET  # Power of phase 3 in W truePOWER/RealPOWER (connector B)
+REG_POWER_SUM_B = REG_POWER_SUM_A + CONNECTOR_B_OFFSET  # Sum of power on L1+L2+L3 (connector B)
 
-REG_CURRENT_L1_B = 4114         # Current of phase 1 in mA (connector B)
-REG_CURRENT_L2_B = 4115         # Current of phase 2 in mA (connector B)
-REG_CURRENT_L3_B = 4116         # Current of phase 3 in mA (connector B)
+REG_CURRENT_L1_B = REG_CURRENT_L1_A + CONNECTOR_B_OFFSET  # Current of phase 1 in mA (connector B)
+REG_CURRENT_L2_B = REG_CURRENT_L2_A + CONNECTOR_B_OFFSET  # Current of phase 2 in mA (connector B)
+REG_CURRENT_L3_B = REG_CURRENT_L3_A + CONNECTOR_B_OFFSET  # Current of phase 3 in mA (connector B)
 
-REG_VOLTAGE_L1_B = 4117         # RMS voltage of phase 1 in 0.1V (connector B)
-REG_VOLTAGE_L2_B = 4118         # RMS voltage of phase 2 in 0.1V (connector B)
-REG_VOLTAGE_L3_B = 4119         # RMS voltage of phase 3 in 0.1V (connector B)
+REG_VOLTAGE_L1_B = REG_VOLTAGE_L1_A + CONNECTOR_B_OFFSET  # RMS voltage of phase 1 in 0.1V (connector B)
+REG_VOLTAGE_L2_B = REG_VOLTAGE_L2_A + CONNECTOR_B_OFFSET  # RMS voltage of phase 2 in 0.1V (connector B)
+REG_VOLTAGE_L3_B = REG_VOLTAGE_L3_A + CONNECTOR_B_OFFSET  # RMS voltage of phase 3 in 0.1V (connector B)
 
-REG_ENERGY_L1_B = 4100          # Energy phase 1 in mWh (x0,001 Wh) (connector B)
-REG_ENERGY_L2_B = 4102          # Energy phase 2 in mWh (x0,001 Wh) (connector B)
-REG_ENERGY_L3_B = 4104          # Energy phase 3 in mWh (x0,001 Wh) (connector B)
-REG_ENERGY_SUM_B = 4106         # Total station energy in mWh (x1 Wh) (connector B)
-REG_ENERGY_FLASH_B = 4108        # Energy in Wh, saved to flash every 24 hours (connector B)
+REG_ENERGY_L1_B = REG_ENERGY_L1_A + CONNECTOR_B_OFFSET  # Energy phase 1 in mWh (x0,001 Wh) (connector B)
+REG_ENERGY_L2_B = REG_ENERGY_L2_A + CONNECTOR_B_OFFSET  # Energy phase 2 in mWh (x0,001 Wh) (connector B)
+REG_ENERGY_L3_B = REG_ENERGY_L3_A + CONNECTOR_B_OFFSET  # Energy phase 3 in mWh (x0,001 Wh) (connector B)
+REG_ENERGY_SUM_B = REG_ENERGY_SUM_A + CONNECTOR_B_OFFSET  # Total station energy in mWh (x1 Wh) (connector B)
+REG_ENERGY_FLASH_B = REG_ENERGY_FLASH_A + CONNECTOR_B_OFFSET  # Energy in Wh, saved to flash every 24 hours (connector B)
 
 # Missing registers in our original implementation that we need to map
 REG_CHARGE_CURRENT_A = 2007     # Using current limit register as charge current (connector A)
@@ -140,11 +164,11 @@ REG_MAX_STATION_CURRENT_A = 2008 # Using PP current limit as max station current
 REG_CHARGING_ENABLE_A = 2001      # Using verify user as charging enable (connector A)
 
 # Second connector equivalent mappings
-REG_CHARGE_CURRENT_B = 2107     # Using current limit register as charge current (connector B)
-REG_CHARGE_ENERGY_B = 4106        # Using total energy as charge energy (connector B)
-REG_CHARGE_POWER_B = 4113          # Using power sum for charge power (connector B)
-REG_MAX_STATION_CURRENT_B = 2108   # Using PP current limit as max station current (connector B)
-REG_CHARGING_ENABLE_B = 2101        # Using verify user as charging enable (connector B)
+REG_CHARGE_CURRENT_B = REG_CHARGE_CURRENT_A + CONNECTOR_B_OFFSET  # Using current limit register as charge current (connector B)
+REG_CHARGE_ENERGY_B = REG_CHARGE_ENERGY_A + CONNECTOR_B_OFFSET  # Using total energy as charge energy (connector B)
+REG_CHARGE_POWER_B = REG_CHARGE_POWER_A + CONNECTOR_B_OFFSET  # Using power sum for charge power (connector B)
+REG_MAX_STATION_CURRENT_B = REG_MAX_STATION_CURRENT_A + CONNECTOR_B_OFFSET  # Using PP current limit as max station current (connector B)
+REG_CHARGING_ENABLE_B = REG_CHARGING_ENABLE_A + CONNECTOR_B_OFFSET  # Using verify user as charging enable (connector B)
 
 # Device information registers
 REG_DEVICE_INFO_START = 6000   # Device information start
@@ -183,8 +207,15 @@ REG_EXT_VOLTAGE_L1 = 4217         # RMS voltage of phase 1 in x0.1V
 REG_EXT_VOLTAGE_L2 = 4218         # RMS voltage of phase 2 in x0.1V
 REG_EXT_VOLTAGE_L3 = 4219         # RMS voltage of phase 3 in x0.1V
 
+# Contiguous wattmeter register blocks as (start, count), from energy L1 to
+# voltage L3, each read with a single request
+BLOCK_METER_A = (REG_ENERGY_L1_A, 20)      # 4000-4019
+BLOCK_METER_B = (REG_ENERGY_L1_B, 20)      # 4100-4119
+BLOCK_METER_EXT = (REG_EXT_ENERGY_L1, 20)  # 4200-4219
+
+# The state tables below are read-only views, so no caller can change them
 # EV State mapping
-WALLBOX_EV_STATES = {
+WALLBOX_EV_STATES = MappingProxyType({
     1: "EV Unplugged",
     2: "EV Connected",
     3: "EV Verified",
@@ -197,10 +228,10 @@ WALLBOX_EV_STATES = {
     10: "EVSE Error",
     13: "No Second Connector",
     90: "Error"
-}
+})
 
 # Detailed EV state descriptions for attributes
-WALLBOX_EV_STATE_DESCRIPTIONS = {
+WALLBOX_EV_STATE_DESCRIPTIONS = MappingProxyType({
     1: "EV unplugged",
     2: "EV connected (Change CP state from unplug 12V to connected 9V)",
     3: "EV verified (Change CP state from 9V to 9V with PWM)",
@@ -213,10 +244,10 @@ WALLBOX_EV_STATE_DESCRIPTIONS = {
     10: "Error EVSE error see CP state",
     13: "EVSE has not second connector it is probab",
     90: "EV error"
-}
+})
 
 # CP State mapping
-CP_STATES = {
+CP_STATES = MappingProxyType({
     1: "Ready (+12V)",
     2: "EV Connected (+9V)",
     3: "Preparing (PWM +9V/-12V)",
@@ -230,10 +261,10 @@ CP_STATES = {
     11: "Unknown State",
     12: "Error: RCD Fault",
     13: "Error: Connector Missing"
-}
+})
 
 # CP State detailed descriptions
-CP_STATE_DESCRIPTIONS = {
+CP_STATE_DESCRIPTIONS = MappingProxyType({
     1: "STATE_H12 - EVSE ready +12V",
     2: "STATE_H9 - EV connected +9V",
     3: "STATE_PWM9 - Preparing (EV connected, user verified, PWM +9V -12V, waiting for car)",
@@ -247,10 +278,10 @@ CP_STATE_DESCRIPTIONS = {
     11: "STATE_UNKNOWN - Unknown",
     12: "STATE_E_RCD_FAULT - Residual current fault",
     13: "STATE_CONNECTOR_MISS - EVSE has not second connector"
-}
+})
 
 # EV State icons mapping
-WALLBOX_EV_STATE_ICONS = {
+WALLBOX_EV_STATE_ICONS = MappingProxyType({
     1: "mdi:ev-plug-disconnect",    # Cable unplugged
     2: "mdi:ev-plug",               # Cable plugged
     3: "mdi:account-check",         # User authenticated
@@ -263,10 +294,10 @@ WALLBOX_EV_STATE_ICONS = {
     10: "mdi:alert-circle",         # EVSE Error
     13: "mdi:connection",           # No second connector
     90: "mdi:alert-circle"          # Error
-}
+})
 
 # CP State icons mapping
-CP_STATE_ICONS = {
+CP_STATE_ICONS = MappingProxyType({
     1: "mdi:ev-station",            # Ready
     2: "mdi:ev-plug-tesla",         # EV Connected
     3: "mdi:refresh-circle",        # Preparing
@@ -280,4 +311,14 @@ CP_STATE_ICONS = {
     11: "mdi:help-circle",          # Unknown State
     12: "mdi:current-dc",           # RCD Fault
     13: "mdi:connection",           # Connector Missing
-}
+})
+
+# Names, descriptions and icons of the contiguous states starting at 1,
+# indexed by state - 1. The tables above stay the source and cover the
+# states past the range
+WALLBOX_EV_STATES_BY_IDX = tuple(WALLBOX_EV_STATES[state] for state in range(1, 11))
+WALLBOX_EV_STATE_DESCRIPTIONS_BY_IDX = tuple(WALLBOX_EV_STATE_DESCRIPTIONS[state] for state in range(1, 11))
+WALLBOX_EV_STATE_ICONS_BY_IDX = tuple(WALLBOX_EV_STATE_ICONS[state] for state in range(1, 11))
+CP_STATES_BY_IDX = tuple(CP_STATES[state] for state in range(1, 14))
+CP_STATE_DESCRIPTIONS_BY_IDX = tuple(CP_STATE_DESCRIPTIONS[state] for state in range(1, 14))
+CP_STATE_ICONS_BY_IDX = tuple(CP_STATE_ICONS[state] for state in range(1, 14))
@@ -0,0 +1,300 @@
+"""Data update coordinator for Olife Energy Wallbox integration."""
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    BLOCK_METER_A,
+    BLOCK_METER_B,
+    BLOCK_METER_EXT,
+    MAX_CONSECUTIVE_ERRORS,
+    REG_CP_STATE_B,
+    REG_CURRENT_LIMIT_B,
+    REG_ERROR_B,
+    REG_EXTERNAL_WATTMETER,
+    REG_LED_PWM,
+    REG_MAX_STATION_CURRENT,
+    REG_PREV_CP_STATE_B,
+    REG_WALLBOX_EV_STATE_B,
+    REG_AUTOMATIC,
+    REG_AUTOMATIC_DIPSWITCH_ON,
+    REG_MAX_CURRENT_DIPSWITCH_ON,
+    REG_BALANCING_EXTERNAL_CURRENT,
+    SLOW_SCAN_INTERVAL,
+)
+from .helpers import PHASE_VALUE_KEYS, async_read_registers, decode_meter_block
+from .modbus_client import OlifeWallboxModbusClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Status and control registers polled on every update, read together by
+# async_read_registers (2100-2107 and 5003-5008)
+POLLED_REGISTERS = (
+    REG_ERROR_B,
+    REG_CP_STATE_B,
+    REG_PREV_CP_STATE_B,
+    REG_WALLBOX_EV_STATE_B,
+    REG_CURRENT_LIMIT_B,
+    REG_AUTOMATIC,
+    REG_AUTOMATIC_DIPSWITCH_ON,
+    REG_MAX_CURRENT_DIPSWITCH_ON,
+    REG_MAX_STATION_CURRENT,
+    REG_BALANCING_EXTERNAL_CURRENT,
+    REG_LED_PWM,
+)
+
+# Registers that rarely change, read on the first update and then every
+# SLOW_SCAN_INTERVAL together with the polled registers. Their last values
+# are reused in between, which saves a request per update
+SLOW_POLLED_REGISTERS = (REG_EXTERNAL_WATTMETER,)
+
+
+class OlifeWallboxCoordinator(DataUpdateCoordinator):
+    """Coordinator polling an Olife Energy Wallbox for all platforms of an entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: OlifeWallboxModbusClient,
+        device_info: dict,
+    ) -> None:
+        """Initialize the coordinator."""
+        options = entry.runtime_data.options
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{entry.title} Coordinator",
+            update_interval=timedelta(seconds=options.scan_interval),
+        )
+        self._client = client
+        self._device_info = device_info
+        self._host = entry.data[CONF_HOST]
+        self._port = entry.data.get(CONF_PORT, 502)
+        self._num_connectors = device_info.get("num_connectors", 1)
+        self._enable_error_sensors = options.enable_error_sensors
+
+        # State used to only log changes instead of every update
+        self._last_connected = True
+        self._reset_attempted = False
+        self._last_external_wattmeter_status: Optional[bool] = None
+        self._last_using_external_wattmeter: Optional[bool] = None
+
+        # Last values of the slow polled registers and when they were read
+        self._slow_registers: Dict[int, int] = {}
+        self._slow_read_at: Optional[float] = None
+
+    async def _async_update_data(self) -> Dict[str, Any]:
+        """Fetch data from the Olife Energy Wallbox."""
+        try:
+            # Reuse the existing ModbusClient from the entry runtime data
+            if not await self._client.connect():
+                # Only log connection failure on state change
+                if self._last_connected:
+                    _LOGGER.error("Failed to connect to Olife Wallbox at %s:%s", self._host, self._port)
+                    self._last_connected = False
+                return {}
+
+            # Log successful reconnection
+            if not self._last_connected:
+                _LOGGER.info("Successfully reconnected to Olife Wallbox at %s:%s", self._host, self._port)
+            self._last_connected = True
+
+            # Check if the client has too many consecutive errors
+            if self._client.consecutive_errors > MAX_CONSECUTIVE_ERRORS:
+                # Only log on state change
+                if not self._reset_attempted:
+                    _LOGGER.warning("Too many consecutive errors (%s), attempting connection reset", self._client.consecutive_errors)
+                    self._reset_attempted = True
+
+                await self._client.disconnect()
+                await asyncio.sleep(1)
+                if not await self._client.connect():
+                    _LOGGER.debug("Failed to reset connection after multiple errors (will retry)")
+                    return {}
+                else:
+                    _LOGGER.info("Successfully reset connection after multiple errors")
+                    self._reset_attempted = False
+
+            # Create a data object to store all fetched values
+            data = {}
+
+            # Read the status and control registers in as few requests as
+            # possible, the switch and number entities take their state from
+            # these as well
+            now = time.monotonic()
+            read_slow = self._slow_read_at is None or now - self._slow_read_at >= SLOW_SCAN_INTERVAL
+            addresses = POLLED_REGISTERS + SLOW_POLLED_REGISTERS if read_slow else POLLED_REGISTERS
+            registers = await async_read_registers(self._client, addresses)
+            if read_slow and all(register in registers for register in SLOW_POLLED_REGISTERS):
+                # Only skip the slow registers once all of them were read
+                self._slow_registers = {register: registers[register] for register in SLOW_POLLED_REGISTERS}
+                self._slow_read_at = now
+            for register, value in self._slow_registers.items():
+                registers.setdefault(register, value)
+            data["registers"] = registers
+
+            # Check if the external wattmeter is present
+            external_wattmeter = registers.get(REG_EXTERNAL_WATTMETER)
+            if external_wattmeter is not None:
+                # Get the current status
+                external_wattmeter_present = (external_wattmeter == 1)
+
+                # Check if status has changed, or if this is the first time we're checking
+                if self._last_external_wattmeter_status != external_wattmeter_present:
+
+                    # Log status change or initial status
+                    status_text = "Present" if external_wattmeter_present else "Not present"
+                    if self._last_external_wattmeter_status is not None:
+                        _LOGGER.info("External wattmeter status changed to: %s (register value: %s)", 
+                                   status_text, external_wattmeter)
+                    else:
+                        _LOGGER.info("External wattmeter status: %s (register value: %s)", 
+                                   status_text, external_wattmeter)
+
+                    # Save the status for future reference
+                    self._last_external_wattmeter_status = external_wattmeter_present
+
+                # Store the status for entity use
+                data["external_wattmeter_present"] = external_wattmeter_present
+            else:
+                # Handle error case
+                if self._last_external_wattmeter_status is not False:
+                    _LOGGER.warning("Could not read external wattmeter status, assuming not present")
+                    self._last_external_wattmeter_status = False
+
+                data["external_wattmeter_present"] = False
+
+            # Get the number of connectors and determine which ones to use
+            connectors_in_use = self._device_info.get("connectors_in_use", ["B"])
+
+            # Initialize data structure for each connector
+            # IMPORTANT: We use letter-based naming convention for connectors:
+            # - connector_A: left side connector
+            # - connector_B: right side connector
+            # This standardization reduces confusion and matches physical labeling.
+
+            # For single-connector Wallboxes, we only use the B connector registers (right side)
+            if self._num_connectors == 1:
+                data["connector_B"] = {}
+
+                # Store the polled B connector registers in connector_B only
+                # (no duplication for single-connector)
+                for register, key in (
+                    (REG_WALLBOX_EV_STATE_B, "wallbox_ev_state"),
+                    (REG_CURRENT_LIMIT_B, "current_limit"),
+                    # The device reports the charge current in the current limit register
+                    (REG_CURRENT_LIMIT_B, "charge_current"),
+                    (REG_MAX_STATION_CURRENT, "max_station_current"),
+                    (REG_LED_PWM, "led_pwm"),
+                ):
+                    if register in registers:
+                        data["connector_B"][key] = registers[register]
+
+                # Only store error and CP state sensors if enabled
+                if self._enable_error_sensors:
+                    for register, key in (
+                        (REG_ERROR_B, "error_code"),
+                        (REG_CP_STATE_B, "cp_state"),
+                        (REG_PREV_CP_STATE_B, "prev_cp_state"),
+                    ):
+                        if register in registers:
+                            data["connector_B"][key] = registers[register]
+            else:
+                # Dual-connector setup  
+                data["connector_A"] = {}
+                data["connector_B"] = {}
+                # TODO: Add dual-connector reading logic here if needed
+
+            # Get phase data based on external wattmeter status
+            if data.get("external_wattmeter_present", False):
+                # Only log this when the status changes to reduce verbosity
+                if self._last_using_external_wattmeter is not True:
+                    _LOGGER.info("Using external wattmeter registers for phase data")
+                    self._last_using_external_wattmeter = True
+
+                # Use external wattmeter registers (4200-4219)
+                meter_span = BLOCK_METER_EXT
+            else:
+                # Only log this when the status changes to reduce verbosity
+                if self._last_using_external_wattmeter is not False:
+                    _LOGGER.info("Using internal wattmeter registers for phase data")
+                    self._last_using_external_wattmeter = False
+
+                # Use internal registers based on connector type
+                if "A" in connectors_in_use and "B" in connectors_in_use:
+                    # For dual-connector wallbox, we show phase data from connector A (left side)
+                    meter_span = BLOCK_METER_A
+                else:
+                    # For single-connector wallbox, use the B connector (right side)
+                    meter_span = BLOCK_METER_B
+
+            # The phase registers of a meter (energy, power, current, voltage)
+            # form one contiguous block. The wallbox answers one Modbus request
+            # at a time, so read the whole block in a single transaction
+            # instead of issuing a request per register, and decode it at once
+            meter = decode_meter_block(await self._client.read_holding_registers(*meter_span))
+
+            if self._num_connectors == 1:
+                # The power and energy sums of connector B are in its meter
+                # block, reuse it when it is the block just read
+                if meter_span == BLOCK_METER_B:
+                    meter_b = meter
+                else:
+                    meter_b = decode_meter_block(await self._client.read_holding_registers(*BLOCK_METER_B))
+
+                if meter_b is not None:
+                    # Power sum (total power from all phases)
+                    data["connector_B"]["charge_power"] = meter_b.power_sum
+                    # Summary energy value, also the charge energy
+                    data["connector_B"]["energy_sum"] = meter_b.energy_sum
+                    data["connector_B"]["charge_energy"] = meter_b.energy_sum
+
+            def store_phase_value(key, value):
+                """Store a phase value in the connector(s) it belongs to."""
+                if data.get("external_wattmeter_present", False):
+                    # For external wattmeter on single-connector, only store in B
+                    if self._num_connectors == 1:
+                        data["connector_B"][key] = value
+                    else:
+                        # Store in both connector data structures since it's an external meter
+                        data["connector_A"][key] = value
+                        data["connector_B"][key] = value
+                elif "A" in connectors_in_use and "B" in connectors_in_use:
+                    # For dual connector, store in appropriate connector
+                    if meter_span == BLOCK_METER_A:
+                        data["connector_A"][key] = value
+                    else:
+                        data["connector_B"][key] = value
+                else:
+                    # For single connector, store in connector B
+                    data["connector_B"][key] = value
+
+            # Extract the phase data, the keys match the decoded field names
+            if meter is not None:
+                for key in PHASE_VALUE_KEYS:
+                    store_phase_value(key, getattr(meter, key))
+                _LOGGER.debug("Read wattmeter block at %s: %s", meter_span[0], meter)
+
+            # Also extract the totals of the external wattmeter if available,
+            # they are part of the block read above
+            if meter is not None and data.get("external_wattmeter_present", False):
+                # For external wattmeter on single-connector, only store in B,
+                # otherwise in both connectors since it's an external meter
+                ext_connectors = ("connector_B",) if self._num_connectors == 1 else ("connector_A", "connector_B")
+                for connector in ext_connectors:
+                    data[connector]["total_energy_ext"] = meter.energy_sum
+                    data[connector]["saved_energy_ext"] = meter.energy_flash
+                    data[connector]["power_sum"] = meter.power_sum
+
+            return data
+        except Exception as exception:
+            _LOGGER.error("Error updating data: %s", exception)
+            raise UpdateFailed(f"Error updating data: {exception}") from exception
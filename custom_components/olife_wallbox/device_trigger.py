@@ -12,7 +12,7 @@ from homeassistant.const import (
     CONF_TYPE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
@@ -21,7 +21,7 @@ from homeassistant.components.device_automation.exceptions import (
 )
 from homeassistant.components.homeassistant.triggers import state as state_trigger
 
-from .const import DOMAIN, WALLBOX_EV_STATES
+from .const import DATA_EV_STATE_ENTITIES, DOMAIN, WALLBOX_EV_STATES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -52,6 +52,27 @@ TRIGGER_TYPES = {
     TRIGGER_TYPE_ERROR,
 }
 
+# State trigger options of each trigger type, built once from the static
+# state names. "charging_stopped" fires on any transition away from
+# charging (4), the other types on entering their state
+_TRIGGER_STATE_OPTIONS = {
+    trigger_type: {"to": WALLBOX_EV_STATES.get(state_value, STATE_UNKNOWN)}
+    for trigger_type, state_value in TRIGGER_STATE_MAP.items()
+    if state_value is not None
+}
+_TRIGGER_STATE_OPTIONS[TRIGGER_TYPE_CHARGING_STOPPED] = {"from": WALLBOX_EV_STATES[4]}
+
+# Triggers offered for a device, completed with its device id when listed
+_TRIGGER_TEMPLATES = tuple(
+    {
+        CONF_PLATFORM: "device",
+        CONF_DOMAIN: DOMAIN,
+        CONF_TYPE: trigger_type,
+        "name": f"When {trigger_type.replace('_', ' ').title()}",
+    }
+    for trigger_type in TRIGGER_TYPES
+)
+
 TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES),
@@ -59,34 +80,53 @@ TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
 )
 
 
+@callback
+def _async_get_ev_state_entity_id(hass: HomeAssistant, device_id: str) -> Optional[str]:
+    """Return the EV state sensor of a device, or None if it has none.
+
+    The result is cached per device so listing and attaching triggers does
+    not scan the device's entities each time. The cache is dropped whenever
+    the entity registry changes.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get(DATA_EV_STATE_ENTITIES)
+    if cache is None:
+        cache = domain_data[DATA_EV_STATE_ENTITIES] = {}
+
+        @callback
+        def _async_clear_cache(_event: Event) -> None:
+            cache.clear()
+
+        hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _async_clear_cache)
+
+    if device_id not in cache:
+        registry = er.async_get(hass)
+        cache[device_id] = next(
+            (
+                entry.entity_id
+                for entry in er.async_entries_for_device(registry, device_id)
+                if entry.domain == "sensor"
+                and entry.original_name == "EV State"
+                and entry.unique_id
+                and DOMAIN in entry.unique_id
+            ),
+            None,
+        )
+    return cache[device_id]
+
+
 async def async_get_triggers(
     hass: HomeAssistant, device_id: str
 ) -> List[Dict[str, Any]]:
     """List device triggers for Olife Energy Wallbox devices."""
-    registry = er.async_get(hass)
-    triggers = []
+    # The triggers watch the EV state sensor, only offer them if it exists
+    if _async_get_ev_state_entity_id(hass, device_id) is None:
+        return []
 
-    # Find the EV state sensor entity for this device
-    for entry in er.async_entries_for_device(registry, device_id):
-        if entry.domain != "sensor":
-            continue
-
-        if entry.original_name == "EV State" and entry.unique_id and DOMAIN in entry.unique_id:
-            # This is our EV state sensor, add triggers for it
-            for trigger_type in TRIGGER_TYPES:
-                trigger_name = trigger_type.replace("_", " ").title()
-                triggers.append(
-                    {
-                        CONF_PLATFORM: "device",
-                        CONF_DEVICE_ID: device_id,
-                        CONF_DOMAIN: DOMAIN,
-                        CONF_TYPE: trigger_type,
-                        "name": f"When {trigger_name}",
-                    }
-                )
-            break
-
-    return triggers
+    return [
+        {**template, CONF_DEVICE_ID: device_id}
+        for template in _TRIGGER_TEMPLATES
+    ]
 
 
 async def async_attach_trigger(
@@ -98,20 +138,9 @@ async def async_attach_trigger(
     """Attach a trigger."""
     trigger_type = config[CONF_TYPE]
     device_id = config[CONF_DEVICE_ID]
-    registry = er.async_get(hass)
 
     # Find the EV state sensor entity for this device
-    ev_state_entity_id = None
-    for entry in er.async_entries_for_device(registry, device_id):
-        if (
-            entry.domain == "sensor"
-            and entry.original_name == "EV State"
-            and entry.unique_id
-            and DOMAIN in entry.unique_id
-        ):
-            ev_state_entity_id = entry.entity_id
-            break
-
+    ev_state_entity_id = _async_get_ev_state_entity_id(hass, device_id)
     if not ev_state_entity_id:
         raise InvalidDeviceAutomationConfig(
             f"Could not find EV state entity for device {device_id}"
@@ -121,19 +150,9 @@ async def async_attach_trigger(
     trigger_config = {
         CONF_PLATFORM: "state",
         CONF_ENTITY_ID: ev_state_entity_id,
+        **_TRIGGER_STATE_OPTIONS[trigger_type],
     }
 
-    # Special case for "charging_stopped" since we need to monitor transitions from
-    # charging (4) to any other state
-    if trigger_type == TRIGGER_TYPE_CHARGING_STOPPED:
-        trigger_config["from"] = WALLBOX_EV_STATES.get(4)  # From "Charging"
-    else:
-        # For other triggers, we set the "to" state
-        state_value = TRIGGER_STATE_MAP.get(trigger_type)
-        if state_value is not None:
-            readable_state = WALLBOX_EV_STATES.get(state_value, STATE_UNKNOWN)
-            trigger_config["to"] = readable_state
-
     return await state_trigger.async_attach_trigger(
         hass, trigger_config, action, automation_info, platform_type="device"
     ) 
\ No newline at end of file
@@ -1,20 +1,32 @@
 """Diagnostics support for Olife Wallbox."""
 from __future__ import annotations
 
+import time
+from operator import attrgetter
 from typing import Any
-from datetime import datetime
 
-from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PASSWORD
+from homeassistant.const import CONF_HOST, STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN, CONF_SLAVE_ID, CONF_SCAN_INTERVAL
+from .const import CONF_SLAVE_ID, CONF_SCAN_INTERVAL
 
-REDACT_CONFIG = {CONF_HOST}
-TO_REDACT = [CONF_HOST, CONF_PASSWORD, "ip_address", "host"]
+REDACT_CONFIG = frozenset((CONF_HOST,))
+
+# Registry attributes reported for each device and entity, and the keys
+# they are reported under
+DEVICE_KEYS = ("id", "name", "model", "manufacturer", "sw_version")
+_device_values = attrgetter(*DEVICE_KEYS)
+ENTITY_KEYS = ("id", "name", "original_name", "domain", "disabled", "device_id", "unique_id")
+_entity_values = attrgetter(
+    "entity_id", "name", "original_name", "domain", "disabled", "device_id", "unique_id"
+)
+
+# States reported as not available in the entity statistics
+UNAVAILABLE_STATES = frozenset((STATE_UNAVAILABLE, STATE_UNKNOWN))
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
@@ -23,7 +35,7 @@ async def async_get_config_entry_diagnostics(
     data = {
         "entry": {
             "title": entry.title,
-            "data": async_redact_data(dict(entry.data), REDACT_CONFIG),
+            "data": async_redact_data(entry.data, REDACT_CONFIG),
             "options": dict(entry.options),
             "entry_id": entry.entry_id,
             "domain": entry.domain,
@@ -41,35 +53,22 @@ async def async_get_config_entry_diagnostics(
     entity_registry = er.async_get(hass)
 
     # Get device diagnostics
-    data["devices"] = []
-    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
-        device_info = {
-            "id": device.id,
-            "name": device.name,
-            "model": device.model,
-            "manufacturer": device.manufacturer,
-            "sw_version": device.sw_version,
-        }
-        data["devices"].append(device_info)
+    data["devices"] = [
+        dict(zip(DEVICE_KEYS, _device_values(device)))
+        for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id)
+    ]
 
     # Get entity diagnostics
-    data["entities"] = []
-    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
-        entity_info = {
-            "id": entity.entity_id,
-            "name": entity.name,
-            "original_name": entity.original_name,
-            "domain": entity.domain,
-            "disabled": entity.disabled,
-            "device_id": entity.device_id,
-            "unique_id": entity.unique_id,
-        }
-        data["entities"].append(entity_info)
+    data["entities"] = [
+        dict(zip(ENTITY_KEYS, _entity_values(entity)))
+        for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    ]
         
     # Get client info and statistics if available
-    if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
-        coordinator = hass.data[DOMAIN][entry.entry_id].get("coordinator")
-        client = hass.data[DOMAIN][entry.entry_id].get("client")
+    entry_data = getattr(entry, "runtime_data", None)
+    if entry_data is not None:
+        coordinator = entry_data.coordinator
+        client = entry_data.client
         
         if client:
             # Add connection statistics
@@ -78,14 +77,18 @@ async def async_get_config_entry_diagnostics(
                 "connection_errors": client.connection_errors,
                 "consecutive_errors": client.consecutive_errors,
                 "last_successful_connection": client.last_successful_connection.isoformat() if client.last_successful_connection else None,
-                "last_connect_attempt": client._last_connect_attempt.isoformat() if hasattr(client, "_last_connect_attempt") else None,
+                "seconds_since_connect_attempt": (
+                    round(time.monotonic() - client._last_connect_attempt, 1)
+                    if client._last_connect_attempt is not None
+                    else None
+                ),
             }
             
             # Add modbus statistics
             data["statistics"]["modbus"] = {
-                "host": async_redact_data({"host": client._host}, TO_REDACT)["host"],
+                "host": REDACTED,
                 "port": client._port,
-                "slave_id": client._client.unit_id if client._client else None,
+                "slave_id": client._slave_id,
             }
             
         if coordinator:
@@ -95,16 +98,16 @@ async def async_get_config_entry_diagnostics(
                 "data": coordinator.data if coordinator.data else {},
             }
             
-        # Simplified entity statistics - avoid direct entity object access
-        data["statistics"]["entity_errors"] = {}
+        # Simplified entity statistics - avoid direct entity object access.
+        # Include basic state information instead, one state lookup per entity
+        entity_errors = data["statistics"]["entity_errors"] = {}
         for entity_entry in data["entities"]:
             entity_id = entity_entry["id"]
-            entity = hass.states.get(entity_id)
-            if entity:
-                # Include basic state information instead
-                data["statistics"]["entity_errors"][entity_id] = {
-                    "state": entity.state,
-                    "available": entity.state not in ["unavailable", "unknown"],
+            state = hass.states.get(entity_id)
+            if state:
+                entity_errors[entity_id] = {
+                    "state": state.state,
+                    "available": state.state not in UNAVAILABLE_STATES,
                 }
     
     return data 
\ No newline at end of file
@@ -1,10 +1,61 @@
 """Helper functions for Olife Wallbox integration."""
 from __future__ import annotations
 
-from typing import Tuple
+import asyncio
+import logging
+import struct
+from typing import NamedTuple, Optional, Tuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CACHED_DEVICE_INFO, CACHED_DEVICE_INFO_AT
+
+_LOGGER = logging.getLogger(__name__)
 
 DEVICE_ID_DELIMITER = "_"
 
+# Largest hole between two registers that is still read in a single request
+GAP_THRESHOLD = 16
+
+# Modbus limit for registers returned by one read holding registers request
+MAX_REGISTERS_PER_READ = 125
+
+
+# Layout of a wattmeter block (4000-4019, 4100-4119 and 4200-4219): five
+# 32-bit energies sent low word first, then the power of L1-L3 and their
+# sum, the currents and the voltages of L1-L3. Packing the words little
+# endian turns each low/high pair into one little endian 32-bit value
+METER_BLOCK_SIZE = 20  # registers
+METER_BLOCK_FORMAT = struct.Struct("<5I10H")
+_METER_BLOCK_WORDS = struct.Struct(f"<{METER_BLOCK_SIZE}H")
+
+
+class MeterValues(NamedTuple):
+    """Decoded values of a wattmeter block."""
+
+    energy_l1: int  # mWh
+    energy_l2: int
+    energy_l3: int
+    energy_sum: int
+    energy_flash: int  # Wh, saved to flash every 24 hours
+    power_l1: int  # W
+    power_l2: int
+    power_l3: int
+    power_sum: int
+    current_l1: int
+    current_l2: int
+    current_l3: int
+    voltage_l1: int  # 0.1 V
+    voltage_l2: int
+    voltage_l3: int
+
+
+# Per phase values of a wattmeter block, stored under the same keys
+PHASE_VALUE_KEYS = tuple(
+    field for field in MeterValues._fields if field[-2:] in ("l1", "l2", "l3")
+)
+
 
 class DeviceUniqueIdError(ValueError):
     """Raised when a stored Olife device unique_id cannot be parsed."""
@@ -17,17 +68,91 @@ def format_device_unique_id(host: str, port: int, slave_id: int) -> str:
 
 def parse_device_unique_id(unique_id: str) -> Tuple[str, int, int]:
     """Validate and split Olife unique_id into host, port, slave_id."""
-    if not unique_id or DEVICE_ID_DELIMITER not in unique_id:
-        raise DeviceUniqueIdError(f"Missing delimiter in '{unique_id}'")
-    parts = unique_id.split(DEVICE_ID_DELIMITER)
-    if len(parts) != 3:
-        raise DeviceUniqueIdError(f"Expected 3 parts, got {len(parts)} in '{unique_id}'")
-    host, port_raw, slave_raw = (part.strip() for part in parts)
+    # Only the last two segments are port and slave id, split them off the
+    # right so the host is never split
+    try:
+        host, port_raw, slave_raw = unique_id.rsplit(DEVICE_ID_DELIMITER, 2)
+    except (ValueError, AttributeError) as exc:
+        raise DeviceUniqueIdError(f"Expected 3 parts in '{unique_id}'") from exc
     if not host:
         raise DeviceUniqueIdError("Host segment empty")
     try:
-        port = int(port_raw)
-        slave_id = int(slave_raw)
+        return host, int(port_raw), int(slave_raw)
     except ValueError as exc:
         raise DeviceUniqueIdError(f"Non-integer port/slave in '{unique_id}'") from exc
-    return host, port, slave_id
\ No newline at end of file
+
+
+def plan_register_ranges(addresses) -> list[tuple[int, int]]:
+    """Group register addresses into contiguous (start, count) read requests."""
+    ranges = []
+    start = end = None
+    for address in sorted(set(addresses)):
+        if start is not None and address - end <= GAP_THRESHOLD and address - start < MAX_REGISTERS_PER_READ:
+            end = address
+            continue
+        if start is not None:
+            ranges.append((start, end - start + 1))
+        start = end = address
+    if start is not None:
+        ranges.append((start, end - start + 1))
+    return ranges
+
+
+def decode_meter_block(registers) -> Optional[MeterValues]:
+    """Decode the registers of a wattmeter block, None if the read failed."""
+    if registers is None or len(registers) < METER_BLOCK_SIZE:
+        return None
+    words = _METER_BLOCK_WORDS.pack(*registers[:METER_BLOCK_SIZE])
+    return MeterValues._make(METER_BLOCK_FORMAT.unpack(words))
+
+
+async def async_read_registers(client, addresses) -> dict[int, int]:
+    """Read the given registers using as few requests as possible.
+
+    Returns a dict mapping register address to its value. Registers that could
+    not be read are missing from the result, as are registers the device
+    reported as not supported, which are not requested again.
+    """
+    values = {}
+    wanted = set(addresses) - client.unsupported_registers
+    ranges = plan_register_ranges(wanted)
+
+    # The client serialises requests on its lock, so the block reads still
+    # go out one at a time. Gathering only queues them all up front and
+    # keeps one failed block from aborting the others
+    results = await asyncio.gather(
+        *(client.read_holding_registers(start, count) for start, count in ranges),
+        return_exceptions=True,
+    )
+
+    for (start, count), registers in zip(ranges, results):
+        if isinstance(registers, Exception):
+            _LOGGER.debug("Block read of %s registers at %s raised: %s", count, start, registers)
+            registers = None
+        if registers is not None and len(registers) >= count:
+            for offset, value in enumerate(registers[:count]):
+                if start + offset in wanted:
+                    values[start + offset] = value
+            continue
+
+        # The block read failed (e.g. a hole in the range is not readable),
+        # fall back to single register reads for this range only
+        _LOGGER.debug("Block read of %s registers at %s failed, reading individually", count, start)
+        for address in range(start, start + count):
+            if address not in wanted:
+                continue
+            result = await client.read_holding_registers(address, 1)
+            if result:
+                values[address] = result[0]
+    return values
+
+
+@callback
+def async_invalidate_device_info_cache(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop cached device information from the config entry."""
+    if CACHED_DEVICE_INFO not in entry.data:
+        return
+    data = dict(entry.data)
+    data.pop(CACHED_DEVICE_INFO, None)
+    data.pop(CACHED_DEVICE_INFO_AT, None)
+    hass.config_entries.async_update_entry(entry, data=data)
@@ -1,26 +1,35 @@
 """Modbus client for Olife Energy Wallbox."""
 import logging
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 import socket
 import time
-from typing import Optional, List, Union
+from typing import Dict, FrozenSet, Optional, List, Set, Tuple, Union
 
-from pymodbus.client import ModbusTcpClient
+from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
 from pymodbus.pdu import ExceptionResponse
 
 from .const import (
+    DEFAULT_TIMEOUT,
     REG_LED_PWM,
     REG_MAX_STATION_CURRENT
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# Constants for retry logic
-MAX_RETRIES = 3
-RETRY_DELAY = 1  # seconds
-CONNECTION_TIMEOUT = 10  # seconds
+# Time after which a connection not confirmed since is verified with a read
+CONNECTION_VERIFY_INTERVAL = 5 * 60  # seconds
+# Longest time requests fail fast after a failed request
+BREAKER_MAX_OPEN_TIME = 60  # seconds
+CONNECTION_TIMEOUT = DEFAULT_TIMEOUT  # seconds
+
+# Registers whose reads are cached for a few seconds, and for how long.
+# Any read overlapping one of them is cached, block reads included, and is
+# served to later reads within its range. Writes drop the cached reads they
+# overlap
+CACHED_REGISTERS = frozenset((REG_LED_PWM, REG_MAX_STATION_CURRENT))
+REGISTER_CACHE_TTL = 10  # seconds
 
 # Modbus exception codes mapped to human-readable messages
 MODBUS_EXCEPTIONS = {
@@ -36,35 +45,60 @@ MODBUS_EXCEPTIONS = {
     11: "Gateway Target Device Failed to Respond"
 }
 
+# Exception codes meaning a register does not exist on this model
+UNSUPPORTED_EXCEPTION_CODES = frozenset((2, 4))
+
 class OlifeWallboxModbusClient:
     """Modbus client for Olife Energy Wallbox."""
 
-    def __init__(self, host, port, slave_id):
-        """Initialize the Modbus client."""
+    def __init__(self, host, port, slave_id, timeout=CONNECTION_TIMEOUT, cache_ttl=REGISTER_CACHE_TTL):
+        """Initialize the Modbus client.
+
+        A cache_ttl of 0 disables the register cache.
+        """
         self._host = host
         self._port = port
         self._slave_id = slave_id
         
-        # Initialize with minimal parameters
-        self._client = ModbusTcpClient(
-            host=host, 
+        # Use the asyncio client so requests are awaited on the event loop
+        # instead of being handed to an executor thread one by one. The
+        # connection is kept open across polls; reconnecting and its backoff
+        # are handled in connect(), so the client's own reconnect is disabled
+        self._client = AsyncModbusTcpClient(
+            host,
             port=port,
-            timeout=CONNECTION_TIMEOUT
+            timeout=timeout,
+            reconnect_delay=0,
         )
         
-        # Set the slave ID directly as an attribute - this pattern works on most versions
-        self._client.unit_id = slave_id
-        
         self._lock = asyncio.Lock()
         self._connection_lock = asyncio.Lock()
         self._connected = False
-        self._last_connect_attempt = datetime.min
+        # Monotonic time of the last connection attempt, for the backoff
+        self._last_connect_attempt: Optional[float] = None
         self._connection_errors = 0
         self._consecutive_errors = 0
-        self._last_successful_connection = datetime.min
+        # Wall-clock time for display, monotonic time for the staleness check
+        self._last_successful_connection: Optional[datetime] = None
+        self._last_verified: Optional[float] = None
         
-        # Initialize register cache
-        self._register_cache = {}
+        # Monotonic time the device last answered a request, with registers
+        # or with an exception response
+        self._last_response_at: Optional[float] = None
+
+        # Monotonic time until which requests fail fast without retrying
+        self._breaker_open_until: Optional[float] = None
+
+        # Counter for successful connections to reduce logging
+        self._successful_connections_count = 0
+
+        # Register cache: (address, count) -> (monotonic time, values)
+        self._cache_ttl = cache_ttl
+        self._register_cache: Dict[Tuple[int, int], Tuple[float, List[int]]] = {}
+
+        # Registers the device answered with an exception code from
+        # UNSUPPORTED_EXCEPTION_CODES, they are skipped by polled reads
+        self._unsupported_registers: Set[int] = set()
 
     async def connect(self):
         """Connect to the Modbus device with retry logic."""
@@ -77,11 +111,17 @@ class OlifeWallboxModbusClient:
                 _LOGGER.debug("Connection check failed, reconnecting")
                 self._connected = False
 
+        # Another caller is connecting right now. Wait for its outcome
+        # instead of failing on the backoff window it has just started
+        if self._connection_lock.locked():
+            async with self._connection_lock:
+                return self._connected
+
         # Implement backoff for repeated connection failures
-        now = datetime.now()
+        now = time.monotonic()
         backoff_time = min(10 * (2 ** min(self._connection_errors, 5)), 300)  # Max 5 minutes
 
-        if now - self._last_connect_attempt < timedelta(seconds=backoff_time):
+        if self._last_connect_attempt is not None and now - self._last_connect_attempt < backoff_time:
             _LOGGER.debug(
                 "Waiting %s seconds before next connection attempt to %s:%s",
                 backoff_time, self._host, self._port
@@ -90,10 +130,6 @@ class OlifeWallboxModbusClient:
 
         self._last_connect_attempt = now
 
-        # Add counter for successful connections to reduce logging
-        if not hasattr(self, '_successful_connections_count'):
-            self._successful_connections_count = 0
-
         try:
             _LOGGER.debug("Connecting to Olife Wallbox at %s:%s", self._host, self._port)
             async with self._connection_lock:
@@ -104,19 +140,23 @@ class OlifeWallboxModbusClient:
                     else:
                         self._connected = False
 
-                connected = await asyncio.get_event_loop().run_in_executor(
-                    None, self._client.connect
-                )
+                # A failed request only marks the connection as lost, the
+                # transport may still be open on a dead socket. Drop it so
+                # this attempt opens a fresh connection
+                self._client.close()
+                connected = await self._client.connect()
 
                 # Only update state if connection actually succeeded
-                if connected and self._client.socket:
+                if connected and self._client.connected:
                     was_previously_connected = self._connected
                     had_previous_errors = self._connection_errors > 0
 
                     self._connected = True
                     self._connection_errors = 0
                     self._consecutive_errors = 0
-                    self._last_successful_connection = now
+                    self._breaker_open_until = None
+                    self._last_successful_connection = datetime.now()
+                    self._last_verified = time.monotonic()
                     
                     # Increment successful connections counter
                     self._successful_connections_count += 1
@@ -164,19 +204,16 @@ class OlifeWallboxModbusClient:
             return False
 
     async def disconnect(self):
-        """Disconnect from the Modbus device."""
-        if not self._connected:
-            return
+        """Disconnect from the Modbus device.
 
+        The client is closed even when it is not marked as connected, a
+        failed request leaves the transport open on the socket otherwise.
+        """
         try:
             _LOGGER.debug("Disconnecting from Olife Wallbox at %s:%s", self._host, self._port)
             async with self._connection_lock:
-                if not self._connected:
-                    return
                 async with self._lock:
-                    await asyncio.get_event_loop().run_in_executor(
-                        None, self._client.close
-                    )
+                    self._client.close()
                     _LOGGER.debug("Successfully disconnected from Olife Wallbox")
         except ConnectionException as ex:
             _LOGGER.error("Error disconnecting from Olife Wallbox: %s", ex)
@@ -186,134 +223,124 @@ class OlifeWallboxModbusClient:
             self._connected = False
 
     async def read_holding_registers(self, address, count) -> Optional[List[int]]:
-        """Read holding registers with retry mechanism."""
+        """Read holding registers, failing fast while the breaker is open."""
         # Add a small cache for frequently accessed registers
-        cache_key = f"{address}_{count}"
-        if hasattr(self, '_register_cache') and cache_key in self._register_cache:
-            cache_entry = self._register_cache[cache_key]
-            # Only use cache for certain registers and if the cache is fresh (< 10 seconds old)
-            if address in [REG_LED_PWM, REG_MAX_STATION_CURRENT] and \
-               (datetime.now() - cache_entry['timestamp']).total_seconds() < 10:
-                return cache_entry['value']
+        end = address + count
+        use_cache = self._cache_ttl > 0 and any(
+            address <= register < end for register in CACHED_REGISTERS
+        )
+        if use_cache:
+            cached = self._cached_read(address, count)
+            if cached is not None:
+                return cached
+
+        # The device failed repeatedly, fail fast until the breaker closes
+        if self._breaker_open():
+            return None
         
-        for retry in range(MAX_RETRIES):
-            if not await self.connect():
-                if retry < MAX_RETRIES - 1:
-                    _LOGGER.debug(
-                        "Connection failed, retrying in %s seconds (attempt %s/%s)",
-                        RETRY_DELAY, retry + 1, MAX_RETRIES
-                    )
-                    await asyncio.sleep(RETRY_DELAY)
-                    continue
-                return None
+        # A single attempt, a failure opens the breaker instead of retrying
+        if not await self.connect():
+            _LOGGER.debug("Not connected to %s:%s, skipping request at %s", self._host, self._port, address)
+            self._trip_breaker()
+            return None
 
-            try:
-                async with self._lock:
-                    # Start timing the request
-                    start_time = time.time()
-                    
-                    # Use a compatibility layer for different pymodbus versions
-                    try:
-                        # Try newer API pattern
-                        result = await asyncio.get_event_loop().run_in_executor(
-                            None, 
-                            lambda: self._client.read_holding_registers(address, count=count)
-                        )
-                    except TypeError:
-                        try:
-                            # Try older API pattern
-                            result = await asyncio.get_event_loop().run_in_executor(
-                                None, 
-                                lambda: self._client.read_holding_registers(address, count)
-                            )
-                        except Exception as e:
-                            _LOGGER.error("Failed to read registers: %s", e)
-                            return None
-                    
-                    # Log request time for performance monitoring
-                    elapsed = time.time() - start_time
-                    
-                    # Handle different types of errors
-                    if isinstance(result, ExceptionResponse):
-                        exception_code = result.exception_code
-                        exception_msg = MODBUS_EXCEPTIONS.get(
-                            exception_code, f"Unknown exception code: {exception_code}"
-                        )
+        try:
+            async with self._lock:
+                # Start timing the request
+                start_time = time.monotonic()
+                
+                result = await self._client.read_holding_registers(
+                    address, count=count, slave=self._slave_id
+                )
+                
+                # Log request time for performance monitoring
+                elapsed = time.monotonic() - start_time
+                
+                # Handle different types of errors
+                if isinstance(result, ExceptionResponse):
+                    # The device is alive, it just refused this request
+                    self._last_response_at = time.monotonic()
+                    exception_code = result.exception_code
+                    exception_msg = MODBUS_EXCEPTIONS.get(
+                        exception_code, f"Unknown exception code: {exception_code}"
+                    )
+                    if exception_code not in UNSUPPORTED_EXCEPTION_CODES:
                         _LOGGER.error(
                             "Modbus exception reading register %s: %s", 
                             address, exception_msg
                         )
-                        return None
-                    
-                    if hasattr(result, 'isError') and result.isError():
-                        _LOGGER.error("Error reading register %s: %s", address, result)
-                        return None
-                    
-                    if not hasattr(result, 'registers'):
-                        _LOGGER.error(
-                            "Unexpected response format reading register %s: %s", 
-                            address, result
+                    elif count == 1:
+                        # Only a single register read says which register
+                        # is missing, remember it so it is not polled again
+                        if address not in self._unsupported_registers:
+                            _LOGGER.info(
+                                "Register %s not supported by this device (%s), no longer reading it",
+                                address, exception_msg
+                            )
+                            self._unsupported_registers.add(address)
+                    else:
+                        _LOGGER.debug(
+                            "Block read of %s registers at %s not supported: %s",
+                            count, address, exception_msg
                         )
-                        return None
-                    
-                    # Log the register values in decimal and hex format
-                    register_values = result.registers
+                    return None
+                
+                if result.isError():
+                    _LOGGER.error("Error reading register %s: %s", address, result)
+                    return None
+                
+                # Log the register values in decimal and hex format. The
+                # hex strings are only built when debug logging is on
+                register_values = result.registers
+                if _LOGGER.isEnabledFor(logging.DEBUG):
                     hex_values = [f"0x{val:04X}" for val in register_values]
                     _LOGGER.debug(
                         "Read register %s (count: %s) completed in %.3f seconds. Values: %s (hex: %s)",
                         address, count, elapsed, register_values, hex_values
                     )
-                    
-                    # Reset consecutive errors on success
-                    self._consecutive_errors = 0
-                    
-                    # Cache the result for specific registers
-                    if address in [REG_LED_PWM, REG_MAX_STATION_CURRENT]:
-                        if not hasattr(self, '_register_cache'):
-                            self._register_cache = {}
-                        self._register_cache[cache_key] = {
-                            'timestamp': datetime.now(),
-                            'value': register_values
-                        }
-                    
-                    return register_values
-            except (ConnectionException, ModbusException) as ex:
-                self._consecutive_errors += 1
-                self._connected = False
                 
-                if retry < MAX_RETRIES - 1:
-                    _LOGGER.warning(
-                        "Error reading register %s: %s. Retrying in %s seconds (attempt %s/%s)",
-                        address, ex, RETRY_DELAY, retry + 1, MAX_RETRIES
-                    )
-                    await asyncio.sleep(RETRY_DELAY)
-                else:
-                    _LOGGER.error(
-                        "Failed to read register %s after %s attempts: %s",
-                        address, MAX_RETRIES, ex
-                    )
-                    return None
-            except asyncio.CancelledError:
-                _LOGGER.debug("Read operation cancelled for register %s", address)
-                raise  # Re-raise cancellation to properly handle it
-            except Exception as ex:
-                self._consecutive_errors += 1
-                self._connected = False
-                _LOGGER.error(
-                    "Unexpected error reading register %s: %s",
-                    address, ex
-                )
-                if retry < MAX_RETRIES - 1:
-                    _LOGGER.warning("Retrying in %s seconds", RETRY_DELAY)
-                    await asyncio.sleep(RETRY_DELAY)
-                else:
-                    return None
-                    
-        # If we get here, all retries failed
-        return None
+                # Reset consecutive errors on success
+                self._consecutive_errors = 0
+                self._breaker_open_until = None
+                self._last_response_at = time.monotonic()
+                
+                # Cache the result for specific registers
+                if use_cache:
+                    # Stored as a copy, the caller owns the returned list
+                    self._register_cache[(address, count)] = (time.monotonic(), list(register_values))
+                
+                return register_values
+        except (ConnectionException, ModbusException) as ex:
+            self._consecutive_errors += 1
+            self._connected = False
+            _LOGGER.error("Failed to read register %s: %s", address, ex)
+            self._trip_breaker()
+            return None
+        except asyncio.CancelledError:
+            _LOGGER.debug("Read operation cancelled for register %s", address)
+            raise  # Re-raise cancellation to properly handle it
+        except Exception as ex:
+            self._consecutive_errors += 1
+            self._connected = False
+            _LOGGER.error(
+                "Unexpected error reading register %s: %s",
+                address, ex
+            )
+            self._trip_breaker()
+            return None
+
+    async def probe(self, address) -> bool:
+        """Read a register to check that the device answers at all.
+
+        An exception response, e.g. for a register this model lacks, counts
+        as an answer. Only a timeout or a lost connection does not.
+        """
+        started = time.monotonic()
+        await self.read_holding_registers(address, 1)
+        return self._last_response_at is not None and self._last_response_at >= started
 
     async def write_register(self, address, value) -> bool:
-        """Write to a holding register with retry mechanism.
+        """Write to a holding register.
         
         Note: This method uses Function Code 6 (0x06) - Write Single Register.
         If your device requires Function Code 16 (0x10), use write_registers instead.
@@ -322,121 +349,126 @@ class OlifeWallboxModbusClient:
         return await self.write_registers(address, [value])
         
     async def write_registers(self, address, values) -> bool:
-        """Write to holding registers with retry mechanism using Function Code 16 (0x10).
+        """Write to holding registers using Function Code 16 (0x10).
         
         This method uses Function Code 16 (Preset Multiple Registers) as required by some Modbus devices.
         """
-        for retry in range(MAX_RETRIES):
-            if not await self.connect():
-                if retry < MAX_RETRIES - 1:
-                    _LOGGER.debug(
-                        "Connection failed, retrying in %s seconds (attempt %s/%s)",
-                        RETRY_DELAY, retry + 1, MAX_RETRIES
-                    )
-                    await asyncio.sleep(RETRY_DELAY)
-                    continue
-                return False
+        # The device failed repeatedly, fail fast until the breaker closes
+        if self._breaker_open():
+            return False
 
-            try:
-                async with self._lock:
-                    # Log the write operation
-                    _LOGGER.debug(
-                        "Writing values %s to registers starting at %s", 
-                        values, address
-                    )
-                    
-                    # Start timing the request
-                    start_time = time.time()
-                    
-                    # Use a compatibility layer for different pymodbus versions
-                    try:
-                        # Try newer API pattern first
-                        _LOGGER.debug("Attempting to write values %s to register %s using newer API pattern (Function Code 16)", values, address)
-                        result = await asyncio.get_event_loop().run_in_executor(
-                            None,
-                            lambda: self._client.write_registers(address, values=values)
-                        )
-                    except TypeError as te:
-                        _LOGGER.debug("TypeError with newer API pattern: %s. Trying older pattern.", te)
-                        try:
-                            # Try older API pattern
-                            result = await asyncio.get_event_loop().run_in_executor(
-                                None,
-                                lambda: self._client.write_registers(address, values)
-                            )
-                        except Exception as e:
-                            _LOGGER.error("Failed to write registers with older API pattern: %s", e)
-                            return False
-                    except Exception as e:
-                        _LOGGER.error("Failed to write registers with newer API pattern: %s", e)
-                        return False
-                    
-                    # Log request time for performance monitoring
-                    elapsed = time.time() - start_time
-                    _LOGGER.debug(
-                        "Write to registers starting at %s completed in %.3f seconds",
-                        address, elapsed
-                    )
-                    
-                    # Reset consecutive errors on success
-                    self._consecutive_errors = 0
-                    
-                    # Handle different types of errors
-                    if isinstance(result, ExceptionResponse):
-                        exception_code = result.exception_code
-                        exception_msg = MODBUS_EXCEPTIONS.get(
-                            exception_code, f"Unknown exception code: {exception_code}"
-                        )
-                        _LOGGER.error(
-                            "Modbus exception writing to registers starting at %s: %s", 
-                            address, exception_msg
-                        )
-                        return False
-                    
-                    if hasattr(result, 'isError') and result.isError():
-                        _LOGGER.error("Error writing to registers starting at %s: %s", address, result)
-                        return False
-                    
-                    _LOGGER.debug(
-                        "Successfully wrote values %s to registers starting at %s",
-                        values, address
-                    )
-                    return True
-            except (ConnectionException, ModbusException) as ex:
-                self._consecutive_errors += 1
-                self._connected = False
+        # A single attempt, a failure opens the breaker instead of retrying
+        if not await self.connect():
+            _LOGGER.debug("Not connected to %s:%s, skipping request at %s", self._host, self._port, address)
+            self._trip_breaker()
+            return False
+
+        try:
+            async with self._lock:
+                # Log the write operation
+                _LOGGER.debug(
+                    "Writing values %s to registers starting at %s", 
+                    values, address
+                )
                 
-                if retry < MAX_RETRIES - 1:
-                    _LOGGER.warning(
-                        "Error writing to registers starting at %s: %s. Retrying in %s seconds (attempt %s/%s)",
-                        address, ex, RETRY_DELAY, retry + 1, MAX_RETRIES
+                # Start timing the request
+                start_time = time.monotonic()
+                
+                result = await self._client.write_registers(
+                    address, values, slave=self._slave_id
+                )
+                # Whatever the outcome, cached reads of these registers
+                # may be stale now. Dropped under the lock so a read
+                # cannot store an older value after the write
+                self._invalidate_cache(address, len(values))
+                
+                # Log request time for performance monitoring
+                elapsed = time.monotonic() - start_time
+                _LOGGER.debug(
+                    "Write to registers starting at %s completed in %.3f seconds",
+                    address, elapsed
+                )
+                
+                # Handle different types of errors
+                if isinstance(result, ExceptionResponse):
+                    exception_code = result.exception_code
+                    exception_msg = MODBUS_EXCEPTIONS.get(
+                        exception_code, f"Unknown exception code: {exception_code}"
                     )
-                    await asyncio.sleep(RETRY_DELAY)
-                else:
                     _LOGGER.error(
-                        "Failed to write to registers starting at %s after %s attempts: %s",
-                        address, MAX_RETRIES, ex
+                        "Modbus exception writing to registers starting at %s: %s", 
+                        address, exception_msg
                     )
                     return False
-            except asyncio.CancelledError:
-                _LOGGER.debug("Write operation cancelled for registers starting at %s", address)
-                raise  # Re-raise cancellation to properly handle it
-            except Exception as ex:
-                self._consecutive_errors += 1
-                self._connected = False
-                _LOGGER.error(
-                    "Unexpected error writing to registers starting at %s: %s",
-                    address, ex
-                )
-                if retry < MAX_RETRIES - 1:
-                    _LOGGER.warning("Retrying in %s seconds", RETRY_DELAY)
-                    await asyncio.sleep(RETRY_DELAY)
-                else:
+                
+                if result.isError():
+                    _LOGGER.error("Error writing to registers starting at %s: %s", address, result)
                     return False
-                    
-        # If we get here, all retries failed
-        return False
+                
+                _LOGGER.debug(
+                    "Successfully wrote values %s to registers starting at %s",
+                    values, address
+                )
+                
+                # Reset consecutive errors on success
+                self._consecutive_errors = 0
+                self._breaker_open_until = None
+                return True
+        except (ConnectionException, ModbusException) as ex:
+            self._consecutive_errors += 1
+            self._connected = False
+            _LOGGER.error("Failed to write to registers starting at %s: %s", address, ex)
+            self._trip_breaker()
+            return False
+        except asyncio.CancelledError:
+            _LOGGER.debug("Write operation cancelled for registers starting at %s", address)
+            raise  # Re-raise cancellation to properly handle it
+        except Exception as ex:
+            self._consecutive_errors += 1
+            self._connected = False
+            _LOGGER.error(
+                "Unexpected error writing to registers starting at %s: %s",
+                address, ex
+            )
+            self._trip_breaker()
+            return False
         
+    def _breaker_open(self) -> bool:
+        """Return True while requests fail fast after a failed request."""
+        return self._breaker_open_until is not None and time.monotonic() < self._breaker_open_until
+
+    def _trip_breaker(self) -> None:
+        """Fail requests fast for a while, longer the more errors in a row."""
+        # Connect failures only count as connection errors, take whichever
+        # of the two error streaks is longer
+        errors = max(self._consecutive_errors, self._connection_errors)
+        open_for = min(2 ** min(errors, 6), BREAKER_MAX_OPEN_TIME)
+        self._breaker_open_until = time.monotonic() + open_for
+        _LOGGER.debug(
+            "Request to %s:%s failed, failing fast for %s seconds",
+            self._host, self._port, open_for
+        )
+
+    def _cached_read(self, address, count) -> Optional[List[int]]:
+        """Return the given range from a fresh cached read covering it, if any."""
+        now = time.monotonic()
+        end = address + count
+        for (start, length), (read_at, values) in self._register_cache.items():
+            if start <= address and end <= start + length and now - read_at < self._cache_ttl:
+                # Slicing returns a copy, so callers cannot change the cache
+                return values[address - start:end - start]
+        return None
+
+    def _invalidate_cache(self, address, count) -> None:
+        """Drop cached reads overlapping the given register range."""
+        end = address + count
+        stale = [
+            key for key in self._register_cache
+            if key[0] < end and address < key[0] + key[1]
+        ]
+        for key in stale:
+            del self._register_cache[key]
+
     @property
     def connection_errors(self) -> int:
         """Return the number of connection errors."""
@@ -448,8 +480,13 @@ class OlifeWallboxModbusClient:
         return self._consecutive_errors
         
     @property
-    def last_successful_connection(self) -> datetime:
-        """Return the timestamp of the last successful connection."""
+    def unsupported_registers(self) -> FrozenSet[int]:
+        """Return the registers the device reported as not supported."""
+        return frozenset(self._unsupported_registers)
+
+    @property
+    def last_successful_connection(self) -> Optional[datetime]:
+        """Return the timestamp of the last successful connection, if any."""
         return self._last_successful_connection 
 
     async def _check_connection(self) -> bool:
@@ -463,37 +500,24 @@ class OlifeWallboxModbusClient:
             return False
             
         # If the last successful connection was too long ago, force a check
-        now = datetime.now()
-        if now - self._last_successful_connection > timedelta(minutes=5):
+        if self._last_verified is None or time.monotonic() - self._last_verified > CONNECTION_VERIFY_INTERVAL:
             # Too long since last known good connection, force a full check
             _LOGGER.debug("Connection may be stale, performing verification")
             try:
                 # Try to read a register that's unlikely to cause issues
                 # This will verify the connection is working
                 async with self._lock:
-                    try:
-                        # Try newer API pattern first
-                        result = await asyncio.get_event_loop().run_in_executor(
-                            None, 
-                            lambda: self._client.read_holding_registers(2104, count=1)
-                        )
-                    except TypeError:
-                        try:
-                            # Try older API pattern
-                            result = await asyncio.get_event_loop().run_in_executor(
-                                None, 
-                                lambda: self._client.read_holding_registers(2104, 1)
-                            )
-                        except Exception as e:
-                            _LOGGER.debug("Connection check failed: %s", e)
-                            return False
+                    result = await self._client.read_holding_registers(
+                        2104, count=1, slave=self._slave_id
+                    )
                     
-                    if result is None or (hasattr(result, 'isError') and result.isError()):
+                    if result.isError():
                         _LOGGER.debug("Connection check failed: invalid response")
                         return False
                     
                     # Update last successful connection time
-                    self._last_successful_connection = now
+                    self._last_successful_connection = datetime.now()
+                    self._last_verified = time.monotonic()
                     return True
             except Exception as ex:
                 _LOGGER.debug("Connection check failed: %s", ex)
@@ -4,25 +4,20 @@ from typing import Optional
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.const import (
-    CONF_HOST, 
-    CONF_PORT, 
     CONF_NAME, 
     UnitOfElectricCurrent,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    DOMAIN,
-    CONF_SLAVE_ID,
-    CONF_READ_ONLY,
-    DEFAULT_READ_ONLY,
     REG_CURRENT_LIMIT_A,
     REG_CURRENT_LIMIT_B,
     REG_CLOUD_CURRENT_LIMIT_A,
@@ -33,7 +28,6 @@ from .const import (
     ERROR_LOG_THRESHOLD
 )
 from .modbus_client import OlifeWallboxModbusClient
-from .helpers import parse_device_unique_id, DeviceUniqueIdError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,26 +36,24 @@ async def async_setup_entry(
 ):
     """Set up the Olife Energy Wallbox number platform."""
     name = entry.data[CONF_NAME]
-    host = entry.data[CONF_HOST]
-    port = entry.data[CONF_PORT]
-    slave_id = entry.data[CONF_SLAVE_ID]
 
     try:
-        # Use the shared client from hass.data instead of creating a new one
-        entry_data = hass.data[DOMAIN][entry.entry_id]
-        client = entry_data["client"]
-        device_info = entry_data["device_info"]
-        device_unique_id = f"{host}_{port}_{slave_id}"
-        
-        read_only = entry.options.get(CONF_READ_ONLY, DEFAULT_READ_ONLY)
+        # Use the shared client from the entry runtime data instead of creating a new one
+        entry_data = entry.runtime_data
+        client = entry_data.client
+        coordinator = entry_data.coordinator
+        device_info = entry_data.device
+        device_unique_id = entry_data.device_unique_id
+        
+        read_only = entry_data.options.read_only
 
         # Only create entities if not in read-only mode
         if not read_only:
             entities = [
-                OlifeWallboxCurrentLimit(client, name, device_info, device_unique_id),
-                OlifeWallboxLedPwm(client, name, device_info, device_unique_id),
-                OlifeWallboxMaxStationCurrent(client, name, device_info, device_unique_id),
-                OlifeWallboxSolarOffset(hass, entry.entry_id, name, device_info, device_unique_id),
+                OlifeWallboxCurrentLimit(coordinator, client, name, device_info, device_unique_id),
+                OlifeWallboxLedPwm(coordinator, client, name, device_info, device_unique_id),
+                OlifeWallboxMaxStationCurrent(coordinator, client, name, device_info, device_unique_id),
+                OlifeWallboxSolarOffset(hass, entry, name, device_info, device_unique_id),
             ]
 
             async_add_entities(entities)
@@ -70,11 +62,12 @@ async def async_setup_entry(
     except Exception as ex:
         _LOGGER.error("Error setting up Olife Wallbox number platform: %s", ex)
 
-class OlifeWallboxNumberBase(NumberEntity):
+class OlifeWallboxNumberBase(CoordinatorEntity, NumberEntity):
     """Base class for Olife Energy Wallbox number entities."""
     
-    def __init__(self, client, name, device_info, device_unique_id):
+    def __init__(self, coordinator, client, name, device_info, device_unique_id):
         """Initialize the number entity."""
+        super().__init__(coordinator)
         self._client = client
         self._name = name
         self._value = None
@@ -82,40 +75,28 @@ class OlifeWallboxNumberBase(NumberEntity):
         self._device_info = device_info
         self._device_unique_id = device_unique_id
         self._attr_has_entity_name = True
-        self._attr_should_poll = True  # Number entities update via async_update
+        self._attr_should_poll = False  # Coordinator handles updates
         self._error_count = 0
+        # Error count at which the next error is logged
+        self._next_log_count = 1
+        # Availability and value last written to the state machine
+        self._written_state = None
+        self._register = None  # Subclasses need to define the register to read
         
     @property
     def available(self):
         """Return if entity is available."""
-        return self._available
+        return super().available and self._available
         
     @property
     def device_info(self):
         """Return device information."""
-        # Filter device_info to only include valid DeviceInfo parameters
-        # Construct the identifiers from device_unique_id
-        try:
-            host, port, slave_id = parse_device_unique_id(self._device_unique_id)
-        except DeviceUniqueIdError as exc:
-            _LOGGER.error("Invalid device_unique_id format: %s", exc)
-            # Fallback to prevent crash
-            host, port, slave_id = "unknown", 0, 0
-        return {
-            "identifiers": {(DOMAIN, self._device_unique_id)},
-            "name": self._name,
-            "manufacturer": "Olife Energy",
-            "model": self._device_info.get("model", "Wallbox"),
-            "sw_version": self._device_info.get("sw_version", "Unknown"),
-            "hw_version": self._device_info.get("hw_version", "Unknown"),
-            "serial_number": self._device_info.get("serial_number"),
-            "via_device": self._device_info.get("via_device"),
-        }
+        return self._device_info
 
     @property
     def state(self):
         """Return the state of the entity."""
-        if not self._available:
+        if not self.available:
             return STATE_UNAVAILABLE
         if self._value is None:
             return STATE_UNKNOWN
@@ -123,16 +104,64 @@ class OlifeWallboxNumberBase(NumberEntity):
         
     def _should_log_error(self):
         """Determine whether to log an error based on error count."""
-        return self._error_count == 1 or self._error_count % ERROR_LOG_THRESHOLD == 0
+        if self._error_count == 1:
+            # First error after a success, restart the logging schedule
+            self._next_log_count = 1
+        if self._error_count < self._next_log_count:
+            return False
+        self._next_log_count += ERROR_LOG_THRESHOLD
+        return True
+
+    def _update_from_registers(self) -> None:
+        """Update the value of the entity from the polled registers."""
+        # The register does not exist on this model, it is no longer polled
+        if self._register in self._client.unsupported_registers:
+            self._available = False
+            return
+
+        registers = (self.coordinator.data or {}).get("registers", {})
+        value = registers.get(self._register)
+        if value is not None:
+            self._available = True
+            self._value = value
+            self._error_count = 0
+        else:
+            self._error_count += 1
+            if self._should_log_error():
+                _LOGGER.warning(
+                    "Failed to read %s (error count: %s)",
+                    self.name, self._error_count
+                )
+            self._available = False
+
+    async def async_added_to_hass(self) -> None:
+        """Set the initial value from the data already fetched."""
+        self._update_from_registers()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_registers()
+        # Most polls return the same value, skip writing an unchanged state.
+        # Compared with the last written state, as a failed update changes
+        # the availability without touching the polled values
+        state = (self.available, self._value)
+        if state == self._written_state:
+            return
+        self._written_state = state
+        super()._handle_coordinator_update()
 
 class OlifeWallboxCurrentLimit(OlifeWallboxNumberBase):
     """Number entity to control current limit on Olife Energy Wallbox."""
 
-    def __init__(self, client, name, device_info, device_unique_id):
+    def __init__(self, coordinator, client, name, device_info, device_unique_id):
         """Initialize the number entity."""
-        super().__init__(client, name, device_info, device_unique_id)
+        super().__init__(coordinator, client, name, device_info, device_unique_id)
         self._attr_icon = "mdi:current-ac"
         self._attr_entity_category = EntityCategory.CONFIG  # Move to configuration tab
+        # REG_CURRENT_LIMIT_B contains the actual current limit
+        self._register = REG_CURRENT_LIMIT_B
 
     @property
     def name(self):
@@ -211,41 +240,16 @@ class OlifeWallboxCurrentLimit(OlifeWallboxNumberBase):
                 )
             raise HomeAssistantError(f"Error setting current limit: {ex}")
 
-    async def async_update(self):
-        """Update the state of the entity."""
-        try:
-            # Read the current limit value
-            # Use REG_CURRENT_LIMIT_B for reading as it contains the actual current limit
-            result = await self._client.read_holding_registers(REG_CURRENT_LIMIT_B, 1)
-            if result is not None:
-                self._available = True
-                self._value = result[0]
-                self._error_count = 0
-            else:
-                self._error_count += 1
-                if self._should_log_error():
-                    _LOGGER.warning(
-                        "Failed to read current limit (error count: %s)",
-                        self._error_count
-                    )
-                self._available = False
-        except Exception as ex:
-            self._error_count += 1
-            if self._should_log_error():
-                _LOGGER.error(
-                    "Error reading current limit: %s (error count: %s)",
-                    ex, self._error_count
-                )
-            self._available = False
 
 class OlifeWallboxLedPwm(OlifeWallboxNumberBase):
     """Entity for controlling the LED PWM value."""
 
-    def __init__(self, client, name, device_info, device_unique_id):
+    def __init__(self, coordinator, client, name, device_info, device_unique_id):
         """Initialize the number entity."""
-        super().__init__(client, name, device_info, device_unique_id)
+        super().__init__(coordinator, client, name, device_info, device_unique_id)
         self._attr_icon = "mdi:led-on"
         self._attr_entity_category = EntityCategory.CONFIG
+        self._register = REG_LED_PWM
         # Add optimistic mode
         self._attr_assumed_state = True
 
@@ -303,39 +307,17 @@ class OlifeWallboxLedPwm(OlifeWallboxNumberBase):
             self.async_write_ha_state()
             raise HomeAssistantError(f"Error setting LED PWM: {ex}") from ex
 
-    async def async_update(self):
-        """Update the state of the entity."""
-        try:
-            result = await self._client.read_holding_registers(REG_LED_PWM, 1)
-            if result is not None:
-                self._available = True
-                self._value = result[0]
-                self._error_count = 0
-            else:
-                self._error_count += 1
-                if self._should_log_error():
-                    _LOGGER.warning(
-                        "Failed to read LED brightness (error count: %s)",
-                        self._error_count
-                    )
-                self._available = False
-        except Exception as ex:
-            self._error_count += 1
-            if self._should_log_error():
-                _LOGGER.error(
-                    "Error updating LED brightness: %s (error count: %s)",
-                    ex, self._error_count
-                )
-            self._available = False
 
 class OlifeWallboxMaxStationCurrent(OlifeWallboxNumberBase):
     """Entity to display and set the max station current."""
 
-    def __init__(self, client, name, device_info, device_unique_id):
+    def __init__(self, coordinator, client, name, device_info, device_unique_id):
         """Initialize the number entity."""
-        super().__init__(client, name, device_info, device_unique_id)
+        super().__init__(coordinator, client, name, device_info, device_unique_id)
         self._attr_icon = "mdi:current-ac"
         self._attr_entity_category = EntityCategory.CONFIG
+        # Register 5006, the value is in amps
+        self._register = REG_MAX_STATION_CURRENT
         # Add optimistic mode
         self._attr_assumed_state = True
 
@@ -409,40 +391,14 @@ class OlifeWallboxMaxStationCurrent(OlifeWallboxNumberBase):
             self.async_write_ha_state()
             raise HomeAssistantError(f"Error setting max station current: {ex}") from ex
 
-    async def async_update(self):
-        """Update the state of the entity."""
-        try:
-            # Reading register 5006 (REG_MAX_STATION_CURRENT)
-            result = await self._client.read_holding_registers(REG_MAX_STATION_CURRENT, 1)
-            if result is not None:
-                self._available = True
-                # The value is in amps, no conversion needed
-                self._value = result[0]
-                self._error_count = 0
-            else:
-                self._error_count += 1
-                if self._should_log_error():
-                    _LOGGER.warning(
-                        "Failed to read max station current (error count: %s)",
-                        self._error_count
-                    )
-                self._available = False
-        except Exception as ex:
-            self._error_count += 1
-            if self._should_log_error():
-                _LOGGER.error(
-                    "Error updating max station current: %s (error count: %s)",
-                    ex, self._error_count
-                )
-            self._available = False 
 
 class OlifeWallboxSolarOffset(NumberEntity):
     """Number entity for solar charging offset configuration."""
 
-    def __init__(self, hass, entry_id, name, device_info, device_unique_id):
+    def __init__(self, hass, entry, name, device_info, device_unique_id):
         """Initialize the number entity."""
         self.hass = hass
-        self._entry_id = entry_id
+        self._entry = entry
         self._name = name
         self._device_info = device_info
         self._device_unique_id = device_unique_id
@@ -451,16 +407,8 @@ class OlifeWallboxSolarOffset(NumberEntity):
         self._attr_icon = "mdi:solar-power-variant"
         self._attr_entity_category = EntityCategory.CONFIG
         
-        # Get initial value from config or use default
-        from .const import CONF_MIN_CURRENT_OFFSET, DEFAULT_MIN_CURRENT_OFFSET, DOMAIN
-        if DOMAIN in hass.data and entry_id in hass.data[DOMAIN]:
-            entry = hass.config_entries.async_get_entry(entry_id)
-            if entry:
-                self._value = entry.options.get(CONF_MIN_CURRENT_OFFSET, DEFAULT_MIN_CURRENT_OFFSET)
-            else:
-                self._value = DEFAULT_MIN_CURRENT_OFFSET
-        else:
-            self._value = DEFAULT_MIN_CURRENT_OFFSET
+        # Get initial value from the resolved options
+        self._value = entry.runtime_data.options.min_offset
         
     @property
     def name(self):
@@ -507,10 +455,10 @@ class OlifeWallboxSolarOffset(NumberEntity):
         self._value = value
         self.async_write_ha_state()
         
-        # Update the solar optimizer if it exists
-        from .const import DOMAIN
-        if DOMAIN in self.hass.data and self._entry_id in self.hass.data[DOMAIN]:
-            optimizer = self.hass.data[DOMAIN][self._entry_id].get("solar_optimizer")
+        # Update the solar optimizer, creating it if needed so the offset is kept
+        entry_data = getattr(self._entry, "runtime_data", None)
+        if entry_data is not None:
+            optimizer = entry_data.get_solar_optimizer(self.hass)
             if optimizer:
                 optimizer.set_offset(int(value))
                 _LOGGER.info("Solar offset updated to %sA", value)
\ No newline at end of file
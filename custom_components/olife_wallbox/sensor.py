@@ -1,8 +1,5 @@
 """Sensor platform for Olife Energy Wallbox integration."""
 import logging
-from datetime import timedelta
-from typing import Optional, Any, Dict
-import asyncio
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -10,113 +7,33 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import (
-    CONF_HOST,
-    CONF_PORT,
     CONF_NAME,
     UnitOfElectricCurrent,
     UnitOfEnergy,
     UnitOfPower,
-    STATE_UNKNOWN,
-    STATE_UNAVAILABLE,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.config_entries import ConfigEntry, ConfigEntryNotReady
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.event import async_track_time_change, async_track_point_in_time
-from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
-    CONF_SLAVE_ID,
-    CONF_SCAN_INTERVAL,
-    DEFAULT_SCAN_INTERVAL,
-    CONF_ENABLE_PHASE_SENSORS,
-    DEFAULT_ENABLE_PHASE_SENSORS,
-    CONF_ENABLE_ERROR_SENSORS,
-    DEFAULT_ENABLE_ERROR_SENSORS,
-    CONF_READ_ONLY,
-    DEFAULT_READ_ONLY,
-    MAX_CONSECUTIVE_ERRORS,
-    REG_WALLBOX_EV_STATE_A,
-    REG_WALLBOX_EV_STATE_B,
-    REG_CURRENT_LIMIT_A,
-    REG_CURRENT_LIMIT_B,
-    REG_CHARGE_CURRENT_A,
-    REG_CHARGE_CURRENT_B,
-    REG_CHARGE_ENERGY_A,
-    REG_CHARGE_ENERGY_B,
-    REG_CHARGE_POWER_A,
-    REG_CHARGE_POWER_B,
-    REG_ERROR_A,
-    REG_ERROR_B,
-    REG_CP_STATE_A,
-    REG_CP_STATE_B,
-    REG_PREV_CP_STATE_A,
-    REG_PREV_CP_STATE_B,
-    REG_MAX_STATION_CURRENT,
-    REG_LED_PWM,
-    REG_ENERGY_SUM_A,
-    REG_ENERGY_SUM_B,
-    REG_POWER_L1_A,
-    REG_POWER_L1_B,
-    REG_POWER_L2_A,
-    REG_POWER_L2_B,
-    REG_POWER_L3_A,
-    REG_POWER_L3_B,
-    REG_POWER_SUM_A,
-    REG_POWER_SUM_B,
-    REG_CURRENT_L1_A,
-    REG_CURRENT_L1_B,
-    REG_CURRENT_L2_A,
-    REG_CURRENT_L2_B,
-    REG_CURRENT_L3_A,
-    REG_CURRENT_L3_B,
-    REG_VOLTAGE_L1_A,
-    REG_VOLTAGE_L1_B,
-    REG_VOLTAGE_L2_A,
-    REG_VOLTAGE_L2_B,
-    REG_VOLTAGE_L3_A,
-    REG_VOLTAGE_L3_B,
-    REG_ENERGY_L1_A,
-    REG_ENERGY_L1_B,
-    REG_ENERGY_L2_A,
-    REG_ENERGY_L2_B,
-    REG_ENERGY_L3_A,
-    REG_ENERGY_L3_B,
-    REG_ENERGY_FLASH_A,
-    REG_ENERGY_FLASH_B,
-    REG_EXTERNAL_WATTMETER,
     WALLBOX_EV_STATES,
+    WALLBOX_EV_STATES_BY_IDX,
     WALLBOX_EV_STATE_DESCRIPTIONS,
+    WALLBOX_EV_STATE_DESCRIPTIONS_BY_IDX,
     WALLBOX_EV_STATE_ICONS,
+    WALLBOX_EV_STATE_ICONS_BY_IDX,
     CP_STATES,
+    CP_STATES_BY_IDX,
     CP_STATE_DESCRIPTIONS,
+    CP_STATE_DESCRIPTIONS_BY_IDX,
     CP_STATE_ICONS,
-    REG_EXT_ENERGY_L1,
-    REG_EXT_ENERGY_L2,
-    REG_EXT_ENERGY_L3,
-    REG_EXT_ENERGY_TOTAL,
-    REG_EXT_ENERGY_SAVED_FLASH,
-    REG_EXT_POWER_L1,
-    REG_EXT_POWER_L2,
-    REG_EXT_POWER_L3,
-    REG_EXT_POWER_SUM,
-    REG_EXT_CURRENT_L1,
-    REG_EXT_CURRENT_L2,
-    REG_EXT_CURRENT_L3,
-    REG_EXT_VOLTAGE_L1,
-    REG_EXT_VOLTAGE_L2,
-    REG_EXT_VOLTAGE_L3,
+    CP_STATE_ICONS_BY_IDX,
     ERROR_LOG_THRESHOLD
 )
-from .modbus_client import OlifeWallboxModbusClient
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -127,393 +44,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Olife Energy Wallbox sensors."""
     # Get configuration and data from entry
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    client = entry_data.get("client")
-    device_info = entry_data.get("device_info", {})
+    entry_data = entry.runtime_data
+    device_info = entry_data.device_info
     
     # Get the number of connectors from device info
     num_connectors = device_info.get("num_connectors", 1)
     
     # Create a unique ID for the device
-    host = entry.data[CONF_HOST]
-    port = entry.data.get(CONF_PORT, 502)
-    slave_id = entry.data.get(CONF_SLAVE_ID, 1)
-    device_unique_id = f"{host}_{port}_{slave_id}"
+    device_unique_id = entry_data.device_unique_id
     
     # Get device name
     name = entry.data.get(CONF_NAME, "Olife Wallbox")
     
     # Get configuration options
-    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    enable_phase_sensors = entry.options.get(CONF_ENABLE_PHASE_SENSORS, DEFAULT_ENABLE_PHASE_SENSORS)
-    enable_error_sensors = entry.options.get(CONF_ENABLE_ERROR_SENSORS, DEFAULT_ENABLE_ERROR_SENSORS)
+    enable_phase_sensors = entry_data.options.enable_phase_sensors
+    enable_error_sensors = entry_data.options.enable_error_sensors
 
     
-    # Create enhanced device info with the information we collected
-    # Filter device_info to only include valid DeviceInfo parameters
-    enhanced_device_info = DeviceInfo(
-        identifiers={(DOMAIN, device_unique_id)},
-        name=name,
-        manufacturer="Olife Energy",
-        model=device_info.get("model", "Wallbox"),
-        sw_version=device_info.get("sw_version", "Unknown"),
-        hw_version=device_info.get("hw_version", "Unknown"),
-        serial_number=device_info.get("serial_number", None),
-    )
-    
-    # Define update coordinator function
-    async def async_update_data() -> Dict[str, Any]:
-        """Fetch data from the Olife Energy Wallbox."""
-        try:
-            # Reuse the existing ModbusClient from hass.data
-            if not await client.connect():
-                # Only log connection failure on state change
-                if not hasattr(async_update_data, '_last_connected') or async_update_data._last_connected:
-                    _LOGGER.error("Failed to connect to Olife Wallbox at %s:%s", host, port)
-                    async_update_data._last_connected = False
-                return {}
-            
-            # Log successful reconnection
-            if hasattr(async_update_data, '_last_connected') and not async_update_data._last_connected:
-                _LOGGER.info("Successfully reconnected to Olife Wallbox at %s:%s", host, port)
-            async_update_data._last_connected = True
-            
-            # Check if the client has too many consecutive errors
-            if client.consecutive_errors > MAX_CONSECUTIVE_ERRORS:
-                # Only log on state change
-                if not hasattr(async_update_data, '_reset_attempted') or not async_update_data._reset_attempted:
-                    _LOGGER.warning("Too many consecutive errors (%s), attempting connection reset", client.consecutive_errors)
-                    async_update_data._reset_attempted = True
-                    
-                await client.disconnect()
-                await asyncio.sleep(1)
-                if not await client.connect():
-                    _LOGGER.debug("Failed to reset connection after multiple errors (will retry)")
-                    return {}
-                else:
-                    _LOGGER.info("Successfully reset connection after multiple errors")
-                    async_update_data._reset_attempted = False
-            
-            # Create a data object to store all fetched values
-            data = {}
-            
-            # Check if the external wattmeter is present
-            external_wattmeter = await client.read_holding_registers(REG_EXTERNAL_WATTMETER, 1)
-            if external_wattmeter is not None:
-                # Get the current status
-                external_wattmeter_present = (external_wattmeter[0] == 1)
-                
-                # Check if status has changed, or if this is the first time we're checking
-                if not hasattr(async_update_data, 'last_external_wattmeter_status') or \
-                   async_update_data.last_external_wattmeter_status != external_wattmeter_present:
-                    
-                    # Log status change or initial status
-                    status_text = "Present" if external_wattmeter_present else "Not present"
-                    if hasattr(async_update_data, 'last_external_wattmeter_status'):
-                        _LOGGER.info("External wattmeter status changed to: %s (register value: %s)", 
-                                   status_text, external_wattmeter[0])
-                    else:
-                        _LOGGER.info("External wattmeter status: %s (register value: %s)", 
-                                   status_text, external_wattmeter[0])
-                    
-                    # Save the status for future reference
-                    async_update_data.last_external_wattmeter_status = external_wattmeter_present
-                
-                # Store the status for entity use
-                data["external_wattmeter_present"] = external_wattmeter_present
-            else:
-                # Handle error case
-                if not hasattr(async_update_data, 'last_external_wattmeter_status') or \
-                   async_update_data.last_external_wattmeter_status is not False:
-                    _LOGGER.warning("Could not read external wattmeter status, assuming not present")
-                    async_update_data.last_external_wattmeter_status = False
-                
-                data["external_wattmeter_present"] = False
-            
-            # Get the number of connectors and determine which ones to use
-            connectors_in_use = device_info.get("connectors_in_use", ["B"])
-            
-            # Initialize data structure for each connector
-            # IMPORTANT: We use letter-based naming convention for connectors:
-            # - connector_A: left side connector
-            # - connector_B: right side connector
-            # This standardization reduces confusion and matches physical labeling.
-            
-            # For single-connector Wallboxes, we only use the B connector registers (right side)
-            if num_connectors == 1:
-                data["connector_B"] = {}
-                
-                # Read from the B connector registers
-                wallbox_ev_state = await client.read_holding_registers(REG_WALLBOX_EV_STATE_B, 1)
-                current_limit = await client.read_holding_registers(REG_CURRENT_LIMIT_B, 1)
-                charge_current = await client.read_holding_registers(REG_CHARGE_CURRENT_B, 1)
-                max_station_current = await client.read_holding_registers(REG_MAX_STATION_CURRENT, 1)
-                led_pwm = await client.read_holding_registers(REG_LED_PWM, 1)
-                
-                # Store in connector_B only (no duplication for single-connector)
-                if wallbox_ev_state is not None:
-                    data["connector_B"]["wallbox_ev_state"] = wallbox_ev_state[0]
-                
-                if current_limit is not None:
-                    data["connector_B"]["current_limit"] = current_limit[0]
-                
-                if charge_current is not None:
-                    data["connector_B"]["charge_current"] = charge_current[0]
-                
-                if max_station_current is not None:
-                    data["connector_B"]["max_station_current"] = max_station_current[0]
-                
-                if led_pwm is not None:
-                    data["connector_B"]["led_pwm"] = led_pwm[0]
-                
-                # Read power sum (total power from all phases)
-                power_sum = await client.read_holding_registers(REG_POWER_SUM_B, 1)
-                if power_sum is not None:
-                    data["connector_B"]["charge_power"] = power_sum[0]
-
-                # Read the summary energy value (32-bit)
-                energy_sum_extended = await client.read_holding_registers(REG_ENERGY_SUM_B, 2)
-                if energy_sum_extended is not None and len(energy_sum_extended) >= 2:
-                    energy_sum_value = energy_sum_extended[0] + (energy_sum_extended[1] << 16)
-                    data["connector_B"]["energy_sum"] = energy_sum_value
-                    # Also update charge_energy with the correct 32-bit value
-                    data["connector_B"]["charge_energy"] = energy_sum_value
-                
-                # Only read error and CP state sensors if enabled
-                if enable_error_sensors:
-                    # Read error code for B connector
-                    error_code = await client.read_holding_registers(REG_ERROR_B, 1)
-                    cp_state = await client.read_holding_registers(REG_CP_STATE_B, 1)
-                    prev_cp_state = await client.read_holding_registers(REG_PREV_CP_STATE_B, 1)
-                    
-                    # Store in connector_B
-                    if error_code is not None:
-                        data["connector_B"]["error_code"] = error_code[0]
-                    
-                    if cp_state is not None:
-                        data["connector_B"]["cp_state"] = cp_state[0]
-                    
-                    if prev_cp_state is not None:
-                        data["connector_B"]["prev_cp_state"] = prev_cp_state[0]
-            else:
-                # Dual-connector setup  
-                data["connector_A"] = {}
-                data["connector_B"] = {}
-                # TODO: Add dual-connector reading logic here if needed
-            
-            # Get phase data based on external wattmeter status
-            if data.get("external_wattmeter_present", False):
-                # Only log this when the status changes to reduce verbosity
-                if not hasattr(async_update_data, 'last_using_external_wattmeter') or \
-                   async_update_data.last_using_external_wattmeter is not True:
-                    _LOGGER.info("Using external wattmeter registers for phase data")
-                    async_update_data.last_using_external_wattmeter = True
-                
-                # Use external wattmeter registers (4200-4219)
-                power_registers = [REG_EXT_POWER_L1, REG_EXT_POWER_L2, REG_EXT_POWER_L3]
-                current_registers = [REG_EXT_CURRENT_L1, REG_EXT_CURRENT_L2, REG_EXT_CURRENT_L3]
-                voltage_registers = [REG_EXT_VOLTAGE_L1, REG_EXT_VOLTAGE_L2, REG_EXT_VOLTAGE_L3]
-                energy_registers = [REG_EXT_ENERGY_L1, REG_EXT_ENERGY_L2, REG_EXT_ENERGY_L3]
-            else:
-                # Only log this when the status changes to reduce verbosity
-                if not hasattr(async_update_data, 'last_using_external_wattmeter') or \
-                   async_update_data.last_using_external_wattmeter is not False:
-                    _LOGGER.info("Using internal wattmeter registers for phase data")
-                    async_update_data.last_using_external_wattmeter = False
-                
-                # Use internal registers based on connector type
-                if "A" in connectors_in_use and "B" in connectors_in_use:
-                    # For dual-connector wallbox, we show phase data from connector A (left side)
-                    power_registers = [REG_POWER_L1_A, REG_POWER_L2_A, REG_POWER_L3_A]
-                    current_registers = [REG_CURRENT_L1_A, REG_CURRENT_L2_A, REG_CURRENT_L3_A]
-                    voltage_registers = [REG_VOLTAGE_L1_A, REG_VOLTAGE_L2_A, REG_VOLTAGE_L3_A]
-                    energy_registers = [REG_ENERGY_L1_A, REG_ENERGY_L2_A, REG_ENERGY_L3_A]
-                else:
-                    # For single-connector wallbox, use the B connector (right side)
-                    power_registers = [REG_POWER_L1_B, REG_POWER_L2_B, REG_POWER_L3_B]
-                    current_registers = [REG_CURRENT_L1_B, REG_CURRENT_L2_B, REG_CURRENT_L3_B]
-                    voltage_registers = [REG_VOLTAGE_L1_B, REG_VOLTAGE_L2_B, REG_VOLTAGE_L3_B]
-                    energy_registers = [REG_ENERGY_L1_B, REG_ENERGY_L2_B, REG_ENERGY_L3_B]
-            
-            # Read the phase data
-            try:
-                for phase_num in range(1, 4):
-                    # Get the registers for this phase
-                    power_reg = power_registers[phase_num-1]
-                    current_reg = current_registers[phase_num-1]
-                    voltage_reg = voltage_registers[phase_num-1]
-                    energy_reg = energy_registers[phase_num-1]
-                    
-                    # Read power
-                    power_val = await client.read_holding_registers(power_reg, 1)
-                    if power_val is not None:
-                        key = f"power_l{phase_num}"
-                        if data.get("external_wattmeter_present", False):
-                            # For external wattmeter on single-connector, only store in B
-                            if num_connectors == 1:
-                                data["connector_B"][key] = power_val[0]
-                            else:
-                                # Store in both connector data structures since it's an external meter
-                                data["connector_A"][key] = power_val[0]
-                                data["connector_B"][key] = power_val[0]
-                        elif "A" in connectors_in_use and "B" in connectors_in_use:
-                            # For dual connector, store in appropriate connector
-                            if power_reg in [REG_POWER_L1_A, REG_POWER_L2_A, REG_POWER_L3_A]:
-                                data["connector_A"][key] = power_val[0]
-                            else:
-                                data["connector_B"][key] = power_val[0]
-                        else:
-                            # For single connector, store in connector B
-                            data["connector_B"][key] = power_val[0]
-                        
-                        _LOGGER.debug("Read power for phase %s: %s W (raw: 0x%04X)", 
-                                    phase_num, power_val[0], power_val[0])
-                    
-                    # Read current
-                    current_val = await client.read_holding_registers(current_reg, 1)
-                    if current_val is not None:
-                        key = f"current_l{phase_num}"
-                        if data.get("external_wattmeter_present", False):
-                            # For external wattmeter on single-connector, only store in B
-                            if num_connectors == 1:
-                                data["connector_B"][key] = current_val[0]
-                            else:
-                                # Store in both connector data structures since it's an external meter
-                                data["connector_A"][key] = current_val[0]
-                                data["connector_B"][key] = current_val[0]
-                        elif "A" in connectors_in_use and "B" in connectors_in_use:
-                            # For dual connector, store in appropriate connector
-                            if current_reg in [REG_CURRENT_L1_A, REG_CURRENT_L2_A, REG_CURRENT_L3_A]:
-                                data["connector_A"][key] = current_val[0]
-                            else:
-                                data["connector_B"][key] = current_val[0]
-                        else:
-                            # For single connector, store in connector B
-                            data["connector_B"][key] = current_val[0]
-                            
-                        _LOGGER.debug("Read current for phase %s: %s mA (raw: 0x%04X)", 
-                                    phase_num, current_val[0], current_val[0])
-                    
-                    # Read voltage
-                    voltage_val = await client.read_holding_registers(voltage_reg, 1)
-                    if voltage_val is not None:
-                        key = f"voltage_l{phase_num}"
-                        if data.get("external_wattmeter_present", False):
-                            # For external wattmeter on single-connector, only store in B
-                            if num_connectors == 1:
-                                data["connector_B"][key] = voltage_val[0]
-                            else:
-                                # Store in both connector data structures since it's an external meter
-                                data["connector_A"][key] = voltage_val[0]
-                                data["connector_B"][key] = voltage_val[0]
-                        elif "A" in connectors_in_use and "B" in connectors_in_use:
-                            # For dual connector, store in appropriate connector
-                            if voltage_reg in [REG_VOLTAGE_L1_A, REG_VOLTAGE_L2_A, REG_VOLTAGE_L3_A]:
-                                data["connector_A"][key] = voltage_val[0]
-                            else:
-                                data["connector_B"][key] = voltage_val[0]
-                        else:
-                            # For single connector, store in connector B
-                            data["connector_B"][key] = voltage_val[0]
-                            
-                        _LOGGER.debug("Read voltage for phase %s: %s (0.1V) (raw: 0x%04X)", 
-                                    phase_num, voltage_val[0], voltage_val[0])
-                    
-                    # Read energy
-                    energy_val = await client.read_holding_registers(energy_reg, 2)  # Read as 32-bit
-                    if energy_val is not None and len(energy_val) >= 2:
-                        energy_val_32bit = ((energy_val[1] & 0xFFFF) << 16) | (energy_val[0] & 0xFFFF)
-                        key = f"energy_l{phase_num}"
-                        if data.get("external_wattmeter_present", False):
-                            # For external wattmeter on single-connector, only store in B
-                            if num_connectors == 1:
-                                data["connector_B"][key] = energy_val_32bit
-                            else:
-                                # Store in both connector data structures since it's an external meter
-                                data["connector_A"][key] = energy_val_32bit
-                                data["connector_B"][key] = energy_val_32bit
-                        elif "A" in connectors_in_use and "B" in connectors_in_use:
-                            # For dual connector, store in appropriate connector
-                            if energy_reg in [REG_ENERGY_L1_A, REG_ENERGY_L2_A, REG_ENERGY_L3_A]:
-                                data["connector_A"][key] = energy_val_32bit
-                            else:
-                                data["connector_B"][key] = energy_val_32bit
-                        else:
-                            # For single connector, store in connector B
-                            data["connector_B"][key] = energy_val_32bit
-                            
-                        _LOGGER.debug("Read energy for phase %s: %s mWh (raw: [0x%04X, 0x%04X], combined: 0x%08X)", 
-                                    phase_num, energy_val_32bit, energy_val[0], energy_val[1], energy_val_32bit)
-            except Exception as ex:
-                _LOGGER.error("Error reading phase data: %s", ex)
-                
-            # Also read total energy from external wattmeter if available
-            if data.get("external_wattmeter_present", False):
-                try:
-                    # Read total energy
-                    total_energy = await client.read_holding_registers(REG_EXT_ENERGY_TOTAL, 2)  # Read as 32-bit
-                    if total_energy is not None and len(total_energy) >= 2:
-                        total_energy_32bit = ((total_energy[1] & 0xFFFF) << 16) | (total_energy[0] & 0xFFFF)
-                        # For external wattmeter on single-connector, only store in B
-                        if num_connectors == 1:
-                            data["connector_B"]["total_energy_ext"] = total_energy_32bit
-                        else:
-                            # Store in both connector data structures since it's an external meter
-                            data["connector_A"]["total_energy_ext"] = total_energy_32bit
-                            data["connector_B"]["total_energy_ext"] = total_energy_32bit
-                        _LOGGER.debug("Read total energy from external wattmeter: %s mWh", total_energy_32bit)
-                        
-                    # Read saved energy
-                    saved_energy = await client.read_holding_registers(REG_EXT_ENERGY_SAVED_FLASH, 2)  # Read as 32-bit
-                    if saved_energy is not None and len(saved_energy) >= 2:
-                        saved_energy_32bit = ((saved_energy[1] & 0xFFFF) << 16) | (saved_energy[0] & 0xFFFF)
-                        # For external wattmeter on single-connector, only store in B
-                        if num_connectors == 1:
-                            data["connector_B"]["saved_energy_ext"] = saved_energy_32bit
-                        else:
-                            # Store in both connector data structures since it's an external meter
-                            data["connector_A"]["saved_energy_ext"] = saved_energy_32bit
-                            data["connector_B"]["saved_energy_ext"] = saved_energy_32bit
-                        _LOGGER.debug("Read saved energy from external wattmeter: %s mWh", saved_energy_32bit)
-                        
-                    # Read total power
-                    total_power = await client.read_holding_registers(REG_EXT_POWER_SUM, 1)
-                    if total_power is not None:
-                        # For external wattmeter on single-connector, only store in B
-                        if num_connectors == 1:
-                            data["connector_B"]["power_sum"] = total_power[0]
-                        else:
-                            # Store in both connector data structures since it's an external meter
-                            data["connector_A"]["power_sum"] = total_power[0]
-                            data["connector_B"]["power_sum"] = total_power[0]
-                        _LOGGER.debug("Read total power from external wattmeter: %s W", total_power[0])
-                except Exception as ex:
-                    _LOGGER.error("Error reading additional data from external wattmeter: %s", ex)
-            
-            return data
-        except Exception as exception:
-            _LOGGER.error("Error updating data: %s", exception)
-            raise UpdateFailed(f"Error updating data: {exception}") from exception
-
-    # Create coordinator
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=f"{name} Sensor",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=scan_interval),
-    )
-
-    # Fetch initial data so we have data when entities initialize
-    try:
-        await coordinator.async_refresh()
-    except Exception as ex:
-        _LOGGER.warning("Error during initial refresh: %s", ex)
-        # Don't store coordinator on error to prevent memory leak
-        raise ConfigEntryNotReady(f"Failed to fetch initial data: {ex}") from ex
-
-    # Store the coordinator in the hass data
-    hass.data[DOMAIN][entry.entry_id]["coordinator"] = coordinator
+    # The coordinator polling the device is shared by all platforms
+    coordinator = entry_data.coordinator
 
     entities = []
     
@@ -533,16 +82,20 @@ async def async_setup_entry(
         # Add a suffix to the device_unique_id if we have multiple connectors
         connector_unique_id = device_unique_id if num_connectors == 1 else f"{device_unique_id}_connector_{connector_letter}"
         
-        # Create a device_info object per connector
-        connector_device_info = DeviceInfo(
-            identifiers={(DOMAIN, connector_unique_id)},
-            name=connector_name,
-            manufacturer="Olife Energy",
-            model=device_info.get("model", "Wallbox"),
-            sw_version=device_info.get("sw_version", "Unknown"),
-            hw_version=device_info.get("hw_version", "Unknown"),
-            via_device=(DOMAIN, device_unique_id) if num_connectors > 1 else None,
-        )
+        # Single-connector wallboxes share the device info of the entry,
+        # otherwise create a device_info object per connector
+        if num_connectors == 1:
+            connector_device_info = entry_data.device
+        else:
+            connector_device_info = DeviceInfo(
+                identifiers={(DOMAIN, connector_unique_id)},
+                name=connector_name,
+                manufacturer="Olife Energy",
+                model=device_info.get("model", "Wallbox"),
+                sw_version=device_info.get("sw_version", "Unknown"),
+                hw_version=device_info.get("hw_version", "Unknown"),
+                via_device=(DOMAIN, device_unique_id),
+            )
         
         # Base sensors (always created)
         entities.extend([
@@ -651,6 +204,19 @@ class OlifeWallboxSensor(CoordinatorEntity, SensorEntity):
         self._device_unique_id = device_unique_id
         self._attr_has_entity_name = True
         self._attr_should_poll = False  # Coordinator handles updates
+        # Availability and raw value of the last written state
+        self._last_state = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # The state is derived from the raw value only, skip writing it
+        # when the poll returned the same value
+        state = (self.available, self._get_value_from_data())
+        if state == self._last_state:
+            return
+        self._last_state = state
+        super()._handle_coordinator_update()
     
     @property
     def available(self) -> bool:
@@ -743,6 +309,8 @@ class OlifeWallboxEVStateSensor(OlifeWallboxSensor):
             return None
             
         # Convert state to human-readable text
+        if 1 <= raw_state <= len(WALLBOX_EV_STATES_BY_IDX):
+            return WALLBOX_EV_STATES_BY_IDX[raw_state - 1]
         if raw_state in WALLBOX_EV_STATES:
             return WALLBOX_EV_STATES[raw_state]
         else:
@@ -763,7 +331,9 @@ class OlifeWallboxEVStateSensor(OlifeWallboxSensor):
         }
         
         # Add detailed description if available
-        if raw_state in WALLBOX_EV_STATE_DESCRIPTIONS:
+        if 1 <= raw_state <= len(WALLBOX_EV_STATE_DESCRIPTIONS_BY_IDX):
+            attributes["description"] = WALLBOX_EV_STATE_DESCRIPTIONS_BY_IDX[raw_state - 1]
+        elif raw_state in WALLBOX_EV_STATE_DESCRIPTIONS:
             attributes["description"] = WALLBOX_EV_STATE_DESCRIPTIONS[raw_state]
             
         return attributes
@@ -774,7 +344,9 @@ class OlifeWallboxEVStateSensor(OlifeWallboxSensor):
         raw_state = self._get_value_from_data()
         if not self.available or raw_state is None:
             return "mdi:ev-station-off"
-            
+
+        if 1 <= raw_state <= len(WALLBOX_EV_STATE_ICONS_BY_IDX):
+            return WALLBOX_EV_STATE_ICONS_BY_IDX[raw_state - 1]
         return WALLBOX_EV_STATE_ICONS.get(
             raw_state, 
             "mdi:help-circle-outline"
@@ -959,6 +531,8 @@ class OlifeWallboxCPStateSensor(OlifeWallboxSensor):
             return None
             
         # Convert state to human-readable text
+        if 1 <= raw_state <= len(CP_STATES_BY_IDX):
+            return CP_STATES_BY_IDX[raw_state - 1]
         if raw_state in CP_STATES:
             return CP_STATES[raw_state]
         else:
@@ -979,7 +553,9 @@ class OlifeWallboxCPStateSensor(OlifeWallboxSensor):
         }
         
         # Add detailed description if available
-        if raw_state in CP_STATE_DESCRIPTIONS:
+        if 1 <= raw_state <= len(CP_STATE_DESCRIPTIONS_BY_IDX):
+            attributes["description"] = CP_STATE_DESCRIPTIONS_BY_IDX[raw_state - 1]
+        elif raw_state in CP_STATE_DESCRIPTIONS:
             attributes["description"] = CP_STATE_DESCRIPTIONS[raw_state]
             
         return attributes
@@ -990,7 +566,9 @@ class OlifeWallboxCPStateSensor(OlifeWallboxSensor):
         raw_state = self._get_value_from_data()
         if not self.available or raw_state is None:
             return "mdi:help-circle-outline"
-            
+
+        if 1 <= raw_state <= len(CP_STATE_ICONS_BY_IDX):
+            return CP_STATE_ICONS_BY_IDX[raw_state - 1]
         return CP_STATE_ICONS.get(
             raw_state, 
             "mdi:help-circle-outline"
@@ -16,6 +16,8 @@ from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
+    DATA_CLIENTS,
+    DATA_SERVICES,
     CONF_SLAVE_ID,
     REG_CHARGING_ENABLE_A,
     REG_CHARGING_ENABLE_B,
@@ -27,7 +29,11 @@ from .const import (
     REG_LED_PWM,
 )
 from .modbus_client import OlifeWallboxModbusClient
-from .helpers import parse_device_unique_id, DeviceUniqueIdError
+from .helpers import (
+    async_invalidate_device_info_cache,
+    parse_device_unique_id,
+    DeviceUniqueIdError,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +45,7 @@ SERVICE_SET_MAX_CURRENT = "set_max_current"
 SERVICE_SET_LED_BRIGHTNESS = "set_led_brightness"
 SERVICE_RESET_ENERGY_COUNTERS = "reset_energy_counters"
 SERVICE_RELOAD_INTEGRATION = "reload"
+SERVICE_REFRESH_DEVICE_INFO = "refresh_device_info"
 
 # Service schemas
 WALLBOX_SERVICE_SCHEMA = vol.Schema(
@@ -80,8 +87,10 @@ def _validate_device_identifier(device_id: str) -> None:
     if len(device_id) < 3:
         raise ValueError(f"Device ID too short: {device_id}")
 
-async def _get_client_for_device(hass: HomeAssistant, device_id: str) -> OlifeWallboxModbusClient:
-    """Get the ModbusClient for a device ID."""
+async def _get_client_for_device(
+    hass: HomeAssistant, device_id: str
+) -> tuple[OlifeWallboxModbusClient, bool]:
+    """Get the ModbusClient for a device ID and whether it is shared."""
     # Validate device ID first
     _validate_device_identifier(device_id)
 
@@ -113,19 +122,27 @@ async def _get_client_for_device(hass: HomeAssistant, device_id: str) -> OlifeWa
     except (ValueError, TypeError):
         raise ValueError(f"Invalid device identifier format: {domain_id}")
 
-    client = OlifeWallboxModbusClient(host, port, slave_id)
-    return client
+    # Reuse the client of the loaded entry, the device accepts a single connection
+    shared = hass.data.get(DOMAIN, {}).get(DATA_CLIENTS, {}).get((host, port, slave_id))
+    if shared is not None:
+        return shared["client"], True
+
+    return OlifeWallboxModbusClient(host, port, slave_id), False
 
 
 @asynccontextmanager
 async def async_modbus_client(hass: HomeAssistant, device_id: str):
-    """Context manager that owns the lifetime of short-lived clients."""
-    client = await _get_client_for_device(hass, device_id)
+    """Context manager that owns the lifetime of short-lived clients.
+
+    Shared clients belong to their config entry and are left connected.
+    """
+    client, shared = await _get_client_for_device(hass, device_id)
     try:
         await client.connect()
         yield client
     finally:
-        await client.disconnect()
+        if not shared:
+            await client.disconnect()
 
 async def _set_charging_state(hass: HomeAssistant, device_id: str, enable: bool) -> None:
     """Set the charging state of a wallbox."""
@@ -322,6 +339,25 @@ async def _reload_integration(hass: HomeAssistant, device_id: str = None) -> Non
     else:
         _LOGGER.warning("No Olife Wallbox integrations were reloaded")
 
+async def _refresh_device_info(hass: HomeAssistant, device_id: str) -> None:
+    """Forget the cached device information and read it again from the device.
+
+    Device information is cached in the config entry between setups, use this
+    after replacing or updating the wallbox hardware or firmware.
+    """
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get(device_id)
+    if not device:
+        raise HomeAssistantError(f"Device {device_id} not found")
+
+    for entry_id in device.config_entries:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry is None or entry.domain != DOMAIN:
+            continue
+        _LOGGER.info("Refreshing device information for %s", entry.title)
+        async_invalidate_device_info_cache(hass, entry)
+        await hass.config_entries.async_reload(entry_id)
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Olife Wallbox."""
     
@@ -386,6 +422,14 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         DOMAIN, SERVICE_RESET_ENERGY_COUNTERS, handle_reset_energy_counters, schema=RESET_COUNTERS_SCHEMA
     )
     
+    async def handle_refresh_device_info(call: ServiceCall) -> None:
+        """Handle the refresh device info service call."""
+        await _refresh_device_info(hass, call.data["device_id"])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH_DEVICE_INFO, handle_refresh_device_info, schema=WALLBOX_SERVICE_SCHEMA
+    )
+    
     hass.services.async_register(
         DOMAIN, SERVICE_RELOAD_INTEGRATION, handle_reload_integration, schema=vol.Schema({
             vol.Optional("device_id"): cv.string,
@@ -402,5 +446,7 @@ def async_unload_services(hass: HomeAssistant) -> None:
         SERVICE_SET_LED_BRIGHTNESS,
         SERVICE_RESET_ENERGY_COUNTERS,
         SERVICE_RELOAD_INTEGRATION,
+        SERVICE_REFRESH_DEVICE_INFO,
     ]:
-        hass.services.async_remove(DOMAIN, service) 
\ No newline at end of file
+        hass.services.async_remove(DOMAIN, service)
+    hass.data.get(DOMAIN, {}).pop(DATA_SERVICES, None) 
\ No newline at end of file
@@ -4,25 +4,20 @@ from typing import Optional, Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.const import (
-    CONF_HOST, 
-    CONF_PORT, 
     CONF_NAME,
     STATE_ON,
     STATE_OFF,
     STATE_UNAVAILABLE
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    DOMAIN,
-    CONF_SLAVE_ID,
-    CONF_READ_ONLY,
-    DEFAULT_READ_ONLY,
     REG_AUTOMATIC,
     REG_AUTOMATIC_DIPSWITCH_ON,
     REG_MAX_CURRENT_DIPSWITCH_ON,
@@ -30,7 +25,6 @@ from .const import (
     ERROR_LOG_THRESHOLD
 )
 from .modbus_client import OlifeWallboxModbusClient
-from .helpers import parse_device_unique_id, DeviceUniqueIdError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,41 +34,39 @@ async def async_setup_entry(
     """Set up the Olife Energy Wallbox switch platform."""
     try:
         name = entry.data[CONF_NAME]
-        host = entry.data[CONF_HOST]
-        port = entry.data[CONF_PORT]
-        slave_id = entry.data[CONF_SLAVE_ID]
 
-        # Check if we're in read-only mode
-        read_only = entry.options.get(CONF_READ_ONLY, DEFAULT_READ_ONLY)
+        # Use the shared client and device info from the entry runtime data
+        entry_data = entry.runtime_data
 
-        if read_only:
+        # Check if we're in read-only mode
+        if entry_data.options.read_only:
             _LOGGER.info("Running in read-only mode, no switch entities will be created")
             return
 
-        # Use the shared client and device info from hass.data
-        entry_data = hass.data[DOMAIN][entry.entry_id]
-        client = entry_data["client"]
-        device_info = entry_data["device_info"]
-        device_unique_id = f"{host}_{port}_{slave_id}"
+        client = entry_data.client
+        coordinator = entry_data.coordinator
+        device_info = entry_data.device
+        device_unique_id = entry_data.device_unique_id
             
         entities = [
             # OlifeWallboxChargingAuthorizationSwitch(client, name, device_info, device_unique_id),  # Moved to button platform
-            OlifeWallboxAutomaticGlobalSwitch(client, name, device_info, device_unique_id),  # Automatic mode (main control)
-            OlifeWallboxAutomaticDipswitchSwitch(client, name, device_info, device_unique_id),  # Automatic mode dipswitch control
-            OlifeWallboxMaxCurrentDipswitchSwitch(client, name, device_info, device_unique_id),  # Max current dipswitch control
-            OlifeWallboxBalancingExternalCurrentSwitch(client, name, device_info, device_unique_id),
-            OlifeWallboxSolarModeSwitch(hass, entry.entry_id, name, device_info, device_unique_id),  # Solar mode toggle
+            OlifeWallboxAutomaticGlobalSwitch(coordinator, client, name, device_info, device_unique_id),  # Automatic mode (main control)
+            OlifeWallboxAutomaticDipswitchSwitch(coordinator, client, name, device_info, device_unique_id),  # Automatic mode dipswitch control
+            OlifeWallboxMaxCurrentDipswitchSwitch(coordinator, client, name, device_info, device_unique_id),  # Max current dipswitch control
+            OlifeWallboxBalancingExternalCurrentSwitch(coordinator, client, name, device_info, device_unique_id),
+            OlifeWallboxSolarModeSwitch(hass, entry, name, device_info, device_unique_id),  # Solar mode toggle
         ]
         
         async_add_entities(entities)
     except Exception as ex:
         _LOGGER.error("Error setting up Olife Wallbox switch platform: %s", ex)
 
-class OlifeWallboxSwitchBase(SwitchEntity):
+class OlifeWallboxSwitchBase(CoordinatorEntity, SwitchEntity):
     """Base class for Olife Energy Wallbox switches."""
 
-    def __init__(self, client, name, device_info, device_unique_id):
+    def __init__(self, coordinator, client, name, device_info, device_unique_id):
         """Initialize the switch."""
+        super().__init__(coordinator)
         self._client = client
         self._name = name
         self._is_on = False
@@ -82,14 +74,18 @@ class OlifeWallboxSwitchBase(SwitchEntity):
         self._device_info = device_info
         self._device_unique_id = device_unique_id
         self._attr_has_entity_name = True
-        self._attr_should_poll = True  # Switches update via async_update
+        self._attr_should_poll = False  # Coordinator handles updates
         self._error_count = 0
+        # Error count at which the next error is logged
+        self._next_log_count = 1
+        # Availability and value last written to the state machine
+        self._written_state = None
         self._register = None  # Subclasses need to define this
         
     @property
     def available(self):
         """Return if entity is available."""
-        return self._available
+        return super().available and self._available
         
     @property
     def is_on(self):
@@ -99,34 +95,24 @@ class OlifeWallboxSwitchBase(SwitchEntity):
     @property
     def device_info(self):
         """Return device information."""
-        # Filter device_info to only include valid DeviceInfo parameters
-        # Construct the identifiers from device_unique_id
-        try:
-            host, port, slave_id = parse_device_unique_id(self._device_unique_id)
-        except DeviceUniqueIdError as exc:
-            _LOGGER.error("Invalid device_unique_id format: %s", exc)
-            # Fallback to prevent crash
-            host, port, slave_id = "unknown", 0, 0
-        return {
-            "identifiers": {(DOMAIN, self._device_unique_id)},
-            "name": self._name,
-            "manufacturer": "Olife Energy",
-            "model": self._device_info.get("model", "Wallbox"),
-            "sw_version": self._device_info.get("sw_version", "Unknown"),
-            "hw_version": self._device_info.get("hw_version", "Unknown"),
-            "serial_number": self._device_info.get("serial_number"),
-        }
+        return self._device_info
 
     @property
     def state(self) -> str:
         """Return the state of the entity."""
-        if not self._available:
+        if not self.available:
             return STATE_UNAVAILABLE
         return STATE_ON if self._is_on else STATE_OFF
         
     def _should_log_error(self):
         """Determine whether to log an error based on error count."""
-        return self._error_count == 1 or self._error_count % ERROR_LOG_THRESHOLD == 0
+        if self._error_count == 1:
+            # First error after a success, restart the logging schedule
+            self._next_log_count = 1
+        if self._error_count < self._next_log_count:
+            return False
+        self._next_log_count += ERROR_LOG_THRESHOLD
+        return True
         
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -198,57 +184,61 @@ class OlifeWallboxSwitchBase(SwitchEntity):
                 )
             raise HomeAssistantError(f"Error turning off {self.name}: {ex}")
             
-    async def async_update(self):
-        """Update the state of the switch."""
+    def _update_from_registers(self) -> None:
+        """Update the state of the switch from the polled registers."""
         if not self._register:
             _LOGGER.error("Register not defined for %s", self.name)
             self._available = False
             return
-            
-        try:
-            result = await self._client.read_holding_registers(self._register, 1)
-            if result is not None:
-                self._available = True
-                self._is_on = result[0] == 1
-                self._error_count = 0
-            else:
-                self._error_count += 1
-                if self._should_log_error():
-                    _LOGGER.warning(
-                        "Failed to read %s state (error count: %s)",
-                        self.name, self._error_count
-                    )
-                self._available = False
-        except Exception as ex:
+
+        # The register does not exist on this model, it is no longer polled
+        if self._register in self._client.unsupported_registers:
+            self._available = False
+            return
+
+        registers = (self.coordinator.data or {}).get("registers", {})
+        value = registers.get(self._register)
+        if value is not None:
+            self._available = True
+            self._is_on = value == 1
+            self._error_count = 0
+        else:
             self._error_count += 1
             if self._should_log_error():
-                _LOGGER.error(
-                    "Error updating %s state: %s (error count: %s)",
-                    self.name, ex, self._error_count
+                _LOGGER.warning(
+                    "Failed to read %s state (error count: %s)",
+                    self.name, self._error_count
                 )
             self._available = False
 
+    async def async_added_to_hass(self) -> None:
+        """Set the initial state from the data already fetched."""
+        self._update_from_registers()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_registers()
+        # Most polls return the same value, skip writing an unchanged state.
+        # Compared with the last written state, as a failed update changes
+        # the availability without touching the polled values
+        state = (self.available, self._is_on)
+        if state == self._written_state:
+            return
+        self._written_state = state
+        super()._handle_coordinator_update()
 
 
 class OlifeWallboxAutomaticGlobalSwitch(OlifeWallboxSwitchBase):
     """Switch for Olife Energy Wallbox automatic mode setting (global register 5003)."""
 
-    def __init__(self, client, name, device_info, device_unique_id):
+    def __init__(self, coordinator, client, name, device_info, device_unique_id):
         """Initialize the switch."""
-        super().__init__(client, name, device_info, device_unique_id)
+        super().__init__(coordinator, client, name, device_info, device_unique_id)
         self._attr_icon = "mdi:check-decagram"
         self._register = REG_AUTOMATIC
         self._attr_entity_category = EntityCategory.CONFIG  # Move to configuration tab
-        # Start as unavailable until we can verify register exists
-        self._available = False
-        self._register_available = False
-        
-    @property
-    def available(self):
-        """Return True if entity is available."""
-        if hasattr(self, '_register_not_supported') and self._register_not_supported:
-            return False
-        return self._available and self._register_available
         
     @property
     def name(self):
@@ -271,67 +261,16 @@ class OlifeWallboxAutomaticGlobalSwitch(OlifeWallboxSwitchBase):
         if not self._available:
             return "mdi:lightning-bolt-off"
         return "mdi:lightning-bolt" if self._is_on else "mdi:lightning-bolt-off"
-        
-    async def async_update(self):
-        """Update the switch's state."""
-        try:
-            # Check if we've already determined the register is not available
-            if hasattr(self, '_register_not_supported') and self._register_not_supported:
-                self._available = False
-                self._register_available = False
-                return
-                
-            result = await self._client.read_holding_registers(self._register, 1)
-            if result is not None:
-                self._available = True
-                self._register_available = True
-                self._is_on = bool(result[0])
-                self._error_count = 0
-            else:
-                self._error_count += 1
-                if self._should_log_error():
-                    _LOGGER.warning(
-                        "Failed to read Automatic Mode Global (error count: %s)",
-                        self._error_count
-                    )
-                self._available = False
-        except Exception as ex:
-            self._error_count += 1
-            # Check for specific Modbus exceptions that indicate register is not supported
-            if "Slave Device Failure" in str(ex) or "Illegal Address" in str(ex):
-                # Register not supported by this model
-                if not hasattr(self, '_register_not_supported') or not self._register_not_supported:
-                    _LOGGER.info("Automatic Mode Global register (%s) not supported by this device, disabling entity", 
-                                self._register)
-                    self._register_not_supported = True
-                self._available = False
-                self._register_available = False
-            elif self._should_log_error():
-                _LOGGER.warning(
-                    "Error updating Automatic Mode Global: %s (error count: %s)",
-                    ex, self._error_count
-                )
-            self._available = False
 
 class OlifeWallboxAutomaticDipswitchSwitch(OlifeWallboxSwitchBase):
     """Switch for Olife Energy Wallbox automatic mode dipswitch setting."""
 
-    def __init__(self, client, name, device_info, device_unique_id):
+    def __init__(self, coordinator, client, name, device_info, device_unique_id):
         """Initialize the switch."""
-        super().__init__(client, name, device_info, device_unique_id)
+        super().__init__(coordinator, client, name, device_info, device_unique_id)
         self._attr_icon = "mdi:dip-switch"
         self._register = REG_AUTOMATIC_DIPSWITCH_ON
         self._attr_entity_category = EntityCategory.CONFIG  # Move to configuration tab
-        # Start as unavailable until we can verify register exists
-        self._available = False
-        self._register_available = False
-        
-    @property
-    def available(self):
-        """Return True if entity is available."""
-        if hasattr(self, '_register_not_supported') and self._register_not_supported:
-            return False
-        return self._available and self._register_available
         
     @property
     def name(self):
@@ -354,67 +293,16 @@ class OlifeWallboxAutomaticDipswitchSwitch(OlifeWallboxSwitchBase):
         if not self._available:
             return "mdi:dip-switch"
         return "mdi:toggle-switch" if self._is_on else "mdi:toggle-switch-off"
-        
-    async def async_update(self):
-        """Update the switch's state."""
-        try:
-            # Check if we've already determined the register is not available
-            if hasattr(self, '_register_not_supported') and self._register_not_supported:
-                self._available = False
-                self._register_available = False
-                return
-                
-            result = await self._client.read_holding_registers(self._register, 1)
-            if result is not None:
-                self._available = True
-                self._register_available = True
-                self._is_on = bool(result[0])
-                self._error_count = 0
-            else:
-                self._error_count += 1
-                if self._should_log_error():
-                    _LOGGER.warning(
-                        "Failed to read Automatic Mode Dipswitch (error count: %s)",
-                        self._error_count
-                    )
-                self._available = False
-        except Exception as ex:
-            self._error_count += 1
-            # Check for specific Modbus exceptions that indicate register is not supported
-            if "Slave Device Failure" in str(ex) or "Illegal Address" in str(ex):
-                # Register not supported by this model
-                if not hasattr(self, '_register_not_supported') or not self._register_not_supported:
-                    _LOGGER.info("Automatic Mode Dipswitch register (%s) not supported by this device, disabling entity", 
-                                self._register)
-                    self._register_not_supported = True
-                self._available = False
-                self._register_available = False
-            elif self._should_log_error():
-                _LOGGER.warning(
-                    "Error updating Automatic Mode Dipswitch: %s (error count: %s)",
-                    ex, self._error_count
-                )
-            self._available = False
 
 class OlifeWallboxMaxCurrentDipswitchSwitch(OlifeWallboxSwitchBase):
     """Switch for Olife Energy Wallbox max current dipswitch setting."""
 
-    def __init__(self, client, name, device_info, device_unique_id):
+    def __init__(self, coordinator, client, name, device_info, device_unique_id):
         """Initialize the switch."""
-        super().__init__(client, name, device_info, device_unique_id)
+        super().__init__(coordinator, client, name, device_info, device_unique_id)
         self._attr_icon = "mdi:current-ac"
         self._register = REG_MAX_CURRENT_DIPSWITCH_ON
         self._attr_entity_category = EntityCategory.CONFIG  # Move to configuration tab
-        # Start as unavailable until we can verify register exists
-        self._available = False
-        self._register_available = False
-        
-    @property
-    def available(self):
-        """Return True if entity is available."""
-        if hasattr(self, '_register_not_supported') and self._register_not_supported:
-            return False
-        return self._available and self._register_available
         
     @property
     def name(self):
@@ -437,67 +325,16 @@ class OlifeWallboxMaxCurrentDipswitchSwitch(OlifeWallboxSwitchBase):
         if not self._available:
             return "mdi:current-ac"
         return "mdi:toggle-switch" if self._is_on else "mdi:toggle-switch-off"
-        
-    async def async_update(self):
-        """Update the switch's state."""
-        try:
-            # Check if we've already determined the register is not available
-            if hasattr(self, '_register_not_supported') and self._register_not_supported:
-                self._available = False
-                self._register_available = False
-                return
-                
-            result = await self._client.read_holding_registers(self._register, 1)
-            if result is not None:
-                self._available = True
-                self._register_available = True
-                self._is_on = bool(result[0])
-                self._error_count = 0
-            else:
-                self._error_count += 1
-                if self._should_log_error():
-                    _LOGGER.warning(
-                        "Failed to read Max Current Dipswitch (error count: %s)",
-                        self._error_count
-                    )
-                self._available = False
-        except Exception as ex:
-            self._error_count += 1
-            # Check for specific Modbus exceptions that indicate register is not supported
-            if "Slave Device Failure" in str(ex) or "Illegal Address" in str(ex):
-                # Register not supported by this model
-                if not hasattr(self, '_register_not_supported') or not self._register_not_supported:
-                    _LOGGER.info("Max Current Dipswitch register (%s) not supported by this device, disabling entity", 
-                                self._register)
-                    self._register_not_supported = True
-                self._available = False
-                self._register_available = False
-            elif self._should_log_error():
-                _LOGGER.warning(
-                    "Error updating Max Current Dipswitch: %s (error count: %s)",
-                    ex, self._error_count
-                )
-            self._available = False
 
 class OlifeWallboxBalancingExternalCurrentSwitch(OlifeWallboxSwitchBase):
     """Switch for Olife Energy Wallbox balancing external current setting."""
 
-    def __init__(self, client, name, device_info, device_unique_id):
+    def __init__(self, coordinator, client, name, device_info, device_unique_id):
         """Initialize the switch."""
-        super().__init__(client, name, device_info, device_unique_id)
+        super().__init__(coordinator, client, name, device_info, device_unique_id)
         self._attr_icon = "mdi:electric-switch"
         self._register = REG_BALANCING_EXTERNAL_CURRENT
         self._attr_entity_category = EntityCategory.CONFIG  # Move to configuration tab
-        # Start as unavailable until we can verify register exists
-        self._available = False
-        self._register_available = False
-        
-    @property
-    def available(self):
-        """Return True if entity is available."""
-        if hasattr(self, '_register_not_supported') and self._register_not_supported:
-            return False
-        return self._available and self._register_available
         
     @property
     def name(self):
@@ -520,55 +357,14 @@ class OlifeWallboxBalancingExternalCurrentSwitch(OlifeWallboxSwitchBase):
         if not self._available:
             return "mdi:electric-switch"
         return "mdi:toggle-switch" if self._is_on else "mdi:toggle-switch-off"
-        
-    async def async_update(self):
-        """Update the switch's state."""
-        try:
-            # Check if we've already determined the register is not available
-            if hasattr(self, '_register_not_supported') and self._register_not_supported:
-                self._available = False
-                self._register_available = False
-                return
-                
-            result = await self._client.read_holding_registers(self._register, 1)
-            if result is not None:
-                self._available = True
-                self._register_available = True
-                self._is_on = bool(result[0])
-                self._error_count = 0
-            else:
-                self._error_count += 1
-                if self._should_log_error():
-                    _LOGGER.warning(
-                        "Failed to read Balancing External Current (error count: %s)",
-                        self._error_count
-                    )
-                self._available = False
-        except Exception as ex:
-            self._error_count += 1
-            # Check for specific Modbus exceptions that indicate register is not supported
-            if "Slave Device Failure" in str(ex) or "Illegal Address" in str(ex):
-                # Register not supported by this model
-                if not hasattr(self, '_register_not_supported') or not self._register_not_supported:
-                    _LOGGER.info("Balancing External Current register (%s) not supported by this device, disabling entity", 
-                                self._register)
-                    self._register_not_supported = True
-                self._available = False
-                self._register_available = False
-            elif self._should_log_error():
-                _LOGGER.warning(
-                    "Error updating Balancing External Current: %s (error count: %s)",
-                    ex, self._error_count
-                )
-            self._available = False 
 
 class OlifeWallboxSolarModeSwitch(SwitchEntity):
     """Switch to enable/disable solar mode."""
 
-    def __init__(self, hass, entry_id, name, device_info, device_unique_id):
+    def __init__(self, hass, entry, name, device_info, device_unique_id):
         """Initialize the solar mode switch."""
         self.hass = hass
-        self._entry_id = entry_id
+        self._entry = entry
         self._name = name
         self._device_info = device_info
         self._device_unique_id = device_unique_id
@@ -596,23 +392,7 @@ class OlifeWallboxSolarModeSwitch(SwitchEntity):
     @property
     def device_info(self):
         """Return device information."""
-        # Filter device_info to only include valid DeviceInfo parameters
-        # Construct the identifiers from device_unique_id
-        try:
-            host, port, slave_id = parse_device_unique_id(self._device_unique_id)
-        except DeviceUniqueIdError as exc:
-            _LOGGER.error("Invalid device_unique_id format: %s", exc)
-            # Fallback to prevent crash
-            host, port, slave_id = "unknown", 0, 0
-        return {
-            "identifiers": {(DOMAIN, self._device_unique_id)},
-            "name": self._name,
-            "manufacturer": "Olife Energy",
-            "model": self._device_info.get("model", "Wallbox"),
-            "sw_version": self._device_info.get("sw_version", "Unknown"),
-            "hw_version": self._device_info.get("hw_version", "Unknown"),
-            "serial_number": self._device_info.get("serial_number"),
-        }
+        return self._device_info
         
     @property
     def icon(self):
@@ -624,15 +404,16 @@ class OlifeWallboxSolarModeSwitch(SwitchEntity):
         self._is_on = True
         self.async_write_ha_state()
         
-        # Enable solar optimizer if it exists
-        if DOMAIN in self.hass.data and self._entry_id in self.hass.data[DOMAIN]:
-            optimizer = self.hass.data[DOMAIN][self._entry_id].get("solar_optimizer")
+        # Enable solar optimizer, it is created the first time solar mode is turned on
+        entry_data = getattr(self._entry, "runtime_data", None)
+        if entry_data is not None:
+            optimizer = entry_data.get_solar_optimizer(self.hass)
             if optimizer:
                 await optimizer.async_enable()
                 _LOGGER.info("Solar mode enabled")
             
             # Also enable automatic mode since charging is "free" with solar
-            client = self.hass.data[DOMAIN][self._entry_id].get("client")
+            client = entry_data.client
             if client:
                 try:
                     from .const import REG_AUTOMATIC
@@ -649,8 +430,9 @@ class OlifeWallboxSolarModeSwitch(SwitchEntity):
         self.async_write_ha_state()
         
         # Disable solar optimizer if it exists
-        if DOMAIN in self.hass.data and self._entry_id in self.hass.data[DOMAIN]:
-            optimizer = self.hass.data[DOMAIN][self._entry_id].get("solar_optimizer")
+        entry_data = getattr(self._entry, "runtime_data", None)
+        if entry_data is not None:
+            optimizer = entry_data.solar_optimizer
             if optimizer:
                 optimizer.disable()
                 _LOGGER.info("Solar mode disabled")